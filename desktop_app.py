@@ -5,8 +5,13 @@ PyQt5를 사용한 GUI 버전
 
 import sys
 import os
+import queue
+import threading
+import time
+from collections import deque
 from datetime import datetime
 import logging
+from logging.handlers import RotatingFileHandler
 import cv2
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -14,7 +19,8 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QTextEdit, QGroupBox, QGridLayout, QFrame,
                            QSystemTrayIcon, QMenu, QAction, QMessageBox,
                            QCheckBox, QSpinBox, QSlider, QTabWidget)
-from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt, QSettings
+from PyQt5.QtCore import (QTimer, QThread, pyqtSignal, Qt, QSettings,
+                          QObject, QRunnable, QThreadPool, QEvent, QMutex)
 from PyQt5.QtGui import QPixmap, QImage, QIcon, QFont
 import json
 
@@ -27,6 +33,388 @@ from notification_system import NotificationSystem, SoundNotification
 from scheduler import ClassScheduler
 from logger import AttendanceLogger
 
+# 캡쳐 저장 포맷별 인코딩 옵션 (capture_format 설정으로 선택, 기본 JPEG)
+# - jpg: 인코딩이 빠르고 파일이 작음 (Zoom 화면 확인용으로 화질 충분)
+# - png: 무손실이 필요한 경우 (단색/반복 영역이 많아 낮은 압축 레벨 + RLE로도 용량 차이가 작음)
+CAPTURE_ENCODE_PARAMS = {
+    'jpg': [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+    'png': [cv2.IMWRITE_PNG_COMPRESSION, 1,
+            cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE],
+}
+DEFAULT_CAPTURE_FORMAT = 'jpg'
+
+# 교시 수 (class_schedules 비트마스크 크기)
+CLASS_PERIOD_COUNT = 8
+ALL_CLASSES_MASK = (1 << CLASS_PERIOD_COUNT) - 1
+
+# save_settings에서 저장하는 설정 키 (QSettings 키 = 인스턴스 속성 이름)
+SAVED_SETTING_KEYS = (
+    'required_face_count', 'absence_tolerance', 'manual_duration',
+    'capture_start_minute', 'retry_interval', 'retry_count',
+    'detection_duration_mode', 'target_photo_count', 'capture_format',
+)
+
+# 얼굴 감지 인디케이터 상태별 스타일 (상태가 바뀔 때만 적용)
+FACE_INDICATOR_STYLES = {
+    'idle': "QLabel { background-color: #ff5555; color: white; padding: 10px; border-radius: 5px; }",
+    'ok': "QLabel { background-color: #4CAF50; color: white; padding: 10px; border-radius: 5px; }",
+    'warn': "QLabel { background-color: #FF9800; color: white; padding: 10px; border-radius: 5px; }",
+    'bad': "QLabel { background-color: #f44336; color: white; padding: 10px; border-radius: 5px; }",
+}
+
+# 토글 버튼 상태별 (텍스트, 스타일) - _apply_btn으로 적용
+BUTTON_STATES = {
+    'test_on': ("🟢 테스트 모드 중지",
+                "QPushButton { background-color: #f44336; color: white; font-size: 14px; padding: 10px; }"),
+    'test_off': ("🔴 테스트 모드 시작",
+                 "QPushButton { background-color: #4CAF50; color: white; font-size: 14px; padding: 10px; }"),
+    'manual_on': ("⏹️ 탐지 중지",
+                  "QPushButton { background-color: #f44336; color: white; font-size: 12px; padding: 8px; }"),
+    'manual_off': ("⏰ 지정 시간 탐지 시작",
+                   "QPushButton { background-color: #FF9800; color: white; font-size: 12px; padding: 8px; }"),
+    'monitor_on': ("모니터링 중지",
+                   "QPushButton { background-color: #f44336; color: white; font-size: 14px; padding: 10px; font-weight: bold; }"),
+    'monitor_off': ("모니터링 시작",
+                    "QPushButton { background-color: #4CAF50; color: white; font-size: 14px; padding: 10px; font-weight: bold; }"),
+    'main_on': ("🛑 모니터링 & 자동스케줄 중지",
+                "QPushButton { background-color: #F44336; color: white; font-size: 16px; padding: 15px; font-weight: bold; }"),
+    'main_off': ("🚀 모니터링 & 자동스케줄 시작",
+                 "QPushButton { background-color: #4CAF50; color: white; font-size: 16px; padding: 15px; font-weight: bold; }"),
+    'scheduler_on': ("자동 스케줄 중지",
+                     "QPushButton { background-color: #ff9800; color: white; font-size: 14px; padding: 10px; }"),
+    'scheduler_off': ("자동 스케줄 시작",
+                      "QPushButton { background-color: #2196F3; color: white; font-size: 14px; padding: 10px; }"),
+}
+
+# 현재 교시 라벨 스타일 (수업 중 / 수업 시간 아님)
+CLASS_LABEL_STYLES = {
+    'class': "font-size: 18px; font-weight: bold; color: #4CAF50;",
+    'idle': "font-size: 18px; font-weight: bold; color: #FF5722;",
+}
+
+# 캡쳐 진행상황 라벨 스타일 - 매초 갱신되므로 _set_label_style로 바뀔 때만 적용
+CAPTURE_PROGRESS_STYLES = {
+    'done': "font-size: 14px; font-weight: bold; color: #4CAF50; padding: 10px;",
+    'capturing': "font-size: 14px; font-weight: bold; color: #2196F3; padding: 10px;",
+    'countdown': "font-size: 14px; font-weight: bold; color: #FF9800; padding: 10px;",
+    'finished': "font-size: 14px; font-weight: bold; color: #999; padding: 10px;",
+}
+
+# 모니터링 중 최상단 시간 박스 강조 스타일
+TIME_GROUP_ACTIVE_STYLE = "QGroupBox { border: 3px solid #76FF03; font-weight: bold; }"
+
+# 미리보기 QImage 포맷 (Qt 5.14+는 BGR888을 직접 지원하여 색 변환 불필요)
+try:
+    PREVIEW_IMAGE_FORMAT = QImage.Format_BGR888
+except AttributeError:
+    PREVIEW_IMAGE_FORMAT = QImage.Format_RGB888
+
+# 구버전 Qt에서는 캡쳐 스레드가 미리보기 프레임을 RGB로 변환해서 보냄 (GUI 스레드 변환 없음)
+PREVIEW_NEEDS_RGB = PREVIEW_IMAGE_FORMAT == QImage.Format_RGB888
+
+# 캡쳐 스레드 분석 영역(ROI) 설정
+ROI_MARGIN = 16            # 참가자 박스 외곽 여백 (px)
+ROI_REFRESH_FRAMES = 30    # ROI를 버리고 전체 화면을 다시 탐색하는 주기 (프레임)
+
+# 캡쳐 스레드 대기 간격 (감지 시간대는 CaptureThread.capture_interval 사용)
+CLASS_CAPTURE_INTERVAL_MS = 5000    # 수업 중이지만 감지 시간대가 아니거나 목표 달성
+IDLE_CAPTURE_INTERVAL_MS = 30000    # 수업 시간 외
+
+# 정적 화면 판단 (썸네일 평균 밝기 차이가 임계값 미만이면 이전 분석 결과 재사용)
+STATIC_THUMB_SIZE = 64
+STATIC_DIFF_THRESHOLD = 2.0
+FORCE_DETECT_EVERY = 6     # 정적 화면이어도 이 프레임 수마다 재탐지
+
+# 종료 시 백그라운드 캡쳐 저장 완료 대기 최대 시간
+SAVE_SHUTDOWN_TIMEOUT_MS = 5000
+
+# GUI 로그 파일 (크기 제한 후 회전하여 tail 읽기 비용과 디스크 사용량 제한)
+GUI_LOG_FILE = 'zoom_attendance_gui.log'
+GUI_LOG_MAX_BYTES = 5 * 1024 * 1024
+GUI_LOG_BACKUP_COUNT = 3
+
+# GUI 로그 창 갱신 주기 및 대기 버퍼 크기
+GUI_LOG_FLUSH_MS = 100
+GUI_LOG_BUFFER_SIZE = 2000
+
+# 분석 결과가 같아도 이 프레임 수마다 analysis_ready를 다시 전송 (수신측 상태 갱신 보장)
+ANALYSIS_FORCE_EMIT_EVERY = 10
+
+# 미리보기 최소 갱신 간격 (약 15fps - 저장용 캡쳐는 원본 프레임을 사용하므로 미리보기는 낮춰도 됨)
+PREVIEW_INTERVAL_MS = 66
+
+# 매초 갱신되는 상태 라벨 (init_ui에서 생성 여부 확인)
+REALTIME_LABELS = ('current_time_label', 'current_date_label', 'current_class_label',
+                   'schedule_current_label', 'schedule_attempt_label', 'schedule_next_label',
+                   'capture_progress_label')
+
+
+def _write_image(path: str, frame: np.ndarray) -> bool:
+    """
+    프레임을 파일 확장자에 맞는 포맷(jpg/png)으로 인코딩하여 한 번의 쓰기로 저장
+
+    cv2.imwrite 대신 메모리에서 인코딩 후 파일에 한 번에 기록
+    (한글 경로에서도 저장 가능)
+
+    Args:
+        path (str): 저장 경로
+        frame (np.ndarray): 저장할 BGR 프레임
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    ext = os.path.splitext(path)[1].lower()
+    success, buffer = cv2.imencode(ext, frame, CAPTURE_ENCODE_PARAMS.get(ext[1:], []))
+    if not success:
+        return False
+
+    with open(path, 'wb') as f:
+        f.write(buffer)
+    return True
+
+
+def _fit_size(width: int, height: int, max_width: int, max_height: int):
+    """
+    비율을 유지하며 지정 영역에 맞는 크기 계산
+
+    Args:
+        width (int): 원본 너비
+        height (int): 원본 높이
+        max_width (int): 최대 너비
+        max_height (int): 최대 높이
+
+    Returns:
+        Tuple[int, int]: (너비, 높이)
+    """
+    scale = min(max_width / width, max_height / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _schedules_to_mask(schedules: dict) -> int:
+    """
+    교시별 활성화 설정을 비트마스크로 변환 (1교시 = bit 0)
+
+    Args:
+        schedules (dict): {교시: 활성화 여부}
+
+    Returns:
+        int: 활성화된 교시 비트마스크
+    """
+    return sum(1 << (int(period) - 1) for period, active in schedules.items() if active)
+
+
+def _mask_to_schedules(mask: int) -> dict:
+    """
+    비트마스크를 교시별 활성화 설정으로 변환
+
+    Args:
+        mask (int): 활성화된 교시 비트마스크
+
+    Returns:
+        dict: {교시: 활성화 여부} (1~CLASS_PERIOD_COUNT교시)
+    """
+    return {period: bool(mask >> (period - 1) & 1) for period in range(1, CLASS_PERIOD_COUNT + 1)}
+
+
+def _resize_interpolation(src_width: int, dst_width: int) -> int:
+    """
+    cv2.resize 보간 방식 선택 (축소는 INTER_AREA, 확대는 INTER_LINEAR)
+
+    Args:
+        src_width (int): 원본 너비
+        dst_width (int): 결과 너비
+
+    Returns:
+        int: cv2 보간 플래그
+    """
+    return cv2.INTER_AREA if dst_width < src_width else cv2.INTER_LINEAR
+
+
+def _locate_window(starts: np.ndarray, ends: np.ndarray, now_sec: int):
+    """
+    정렬된 시간대 배열에서 현재 또는 다음 시간대 찾기
+
+    Args:
+        starts (np.ndarray): 시간대 시작 (하루 중 초, 오름차순)
+        ends (np.ndarray): 시간대 종료 (하루 중 초, 오름차순)
+        now_sec (int): 현재 시각 (하루 중 초)
+
+    Returns:
+        Tuple[int, bool]: (시간대 인덱스 - 없으면 -1, 진행 중 여부)
+    """
+    idx = int(np.searchsorted(ends, now_sec))
+    if idx >= len(ends):
+        return -1, False
+    return idx, bool(starts[idx] <= now_sec)
+
+
+def _configure_file_logging():
+    """
+    루트 로거에 회전 파일 핸들러와 콘솔 핸들러 설정 (기존 설정은 교체)
+
+    파일 핸들러는 레코드마다 flush하므로 별도의 줄 단위 버퍼링 설정 없이도
+    refresh_log에서 방금 기록된 로그까지 읽을 수 있음
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler(GUI_LOG_FILE, maxBytes=GUI_LOG_MAX_BYTES,
+                                backupCount=GUI_LOG_BACKUP_COUNT, encoding='utf-8'),
+            logging.StreamHandler()  # 콘솔 출력
+        ],
+        force=True
+    )
+
+
+def _tail_lines(path: str, n: int, block: int = 8192) -> list:
+    """
+    파일 끝에서부터 블록 단위로 거꾸로 읽어 마지막 n줄 반환 (파일 전체를 읽지 않음)
+
+    Args:
+        path (str): 파일 경로
+        n (int): 읽을 줄 수
+        block (int): 한 번에 읽을 바이트 수
+
+    Returns:
+        List[str]: 마지막 n줄 (UTF-8 디코딩, 줄바꿈 제외)
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= n:
+            read_size = min(block, pos)
+            pos -= read_size
+            f.seek(pos)
+            buf = f.read(read_size) + buf
+
+    return [line.decode('utf-8', errors='replace') for line in buf.splitlines()[-n:]]
+
+
+def _format_log_line(line: str) -> str:
+    """
+    로그 파일 한 줄을 로그 창 표시 형식으로 변환
+    "날짜 시간 - 이름 - 레벨 - 메시지" -> "[시간] 이름 - 레벨 - 메시지"
+
+    Args:
+        line (str): 로그 파일의 한 줄
+
+    Returns:
+        str: 표시용 문자열 (형식이 다르면 그대로 반환)
+    """
+    line = line.strip()
+    head, sep1, rest = line.partition(' - ')
+    name_part, sep2, msg_part = rest.partition(' - ')
+    if not (sep1 and sep2):
+        return line
+
+    _, space, clock = head.partition(' ')
+    time_part = clock.partition(' ')[0] if space else head
+    return f"[{time_part}] {name_part} - {msg_part}"
+
+
+class _GuiLogHandler(logging.Handler):
+    """
+    GUI 로그 창용 핸들러 - 어느 스레드에서든 버퍼에만 쌓고, GUI 스레드가 주기적으로 가져감
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = deque(maxlen=GUI_LOG_BUFFER_SIZE)
+        self._buffer_lock = threading.Lock()
+
+    def emit(self, record):
+        try:
+            timestamp = time.strftime('%H:%M:%S', time.localtime(record.created))
+            line = f"[{timestamp}] {self.format(record)}"
+            with self._buffer_lock:
+                self._buffer.append(line)
+        except Exception:
+            self.handleError(record)
+
+    def drain(self) -> list:
+        """
+        대기 중인 로그 줄을 모두 꺼냄
+
+        Returns:
+            List[str]: 포맷된 로그 줄
+        """
+        with self._buffer_lock:
+            lines = list(self._buffer)
+            self._buffer.clear()
+        return lines
+
+
+class _SaveSignals(QObject):
+    """
+    저장 작업 완료 알림용 시그널 (QRunnable은 시그널을 가질 수 없음)
+    """
+
+    finished = pyqtSignal(str, bool, object)  # 파일 경로, 성공 여부, 작업 정보
+
+
+class _ImageSaveTask(QRunnable):
+    """
+    이미지 인코딩 및 파일 저장 작업 (QThreadPool에서 실행)
+    """
+
+    def __init__(self, path: str, frame: np.ndarray, signals: _SaveSignals, context=None):
+        """
+        저장 작업 초기화
+
+        Args:
+            path (str): 저장 경로
+            frame (np.ndarray): 저장할 프레임
+            signals (_SaveSignals): 완료 알림 시그널
+            context: 완료 시 함께 전달할 작업 정보
+        """
+        super().__init__()
+        self.path = path
+        self.frame = frame
+        self.signals = signals
+        self.context = context
+
+    def run(self):
+        try:
+            success = _write_image(self.path, self.frame)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"캡쳐 저장 오류: {e}")
+            success = False
+
+        self.frame = None
+        self.signals.finished.emit(self.path, success, self.context)
+
+
+class _IoTask(QRunnable):
+    """
+    디스크 기록 작업 (QThreadPool에서 실행, 캡쳐 저장과 같은 풀 사용)
+    """
+
+    def __init__(self, func, args: tuple, lock: threading.Lock = None):
+        """
+        기록 작업 초기화
+
+        Args:
+            func: 실행할 함수
+            args (tuple): 함수 인자
+            lock (threading.Lock): 같은 파일을 쓰는 작업끼리 순서대로 실행하기 위한 잠금
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.lock = lock
+
+    def run(self):
+        try:
+            if self.lock is None:
+                self.func(*self.args)
+            else:
+                with self.lock:
+                    self.func(*self.args)
+        except Exception as e:
+            logging.getLogger(__name__).error(f"기록 작업 오류: {e}")
+
+
 class CaptureThread(QThread):
     """
     실시간 화면 캡쳐 및 분석 스레드
@@ -34,7 +422,7 @@ class CaptureThread(QThread):
     
     # 시그널 정의
     frame_ready = pyqtSignal(np.ndarray)  # 시각화된 프레임 (UI 표시용)
-    original_frame_ready = pyqtSignal(np.ndarray)  # 원본 프레임 (캡쳐 저장용)
+    original_frame_ready = pyqtSignal(np.ndarray)  # 원본 프레임 (캡쳐 저장용, 재사용 버퍼이므로 즉시 복사해야 함)
     analysis_ready = pyqtSignal(int, int, list)  # 총 참가자, 얼굴 감지 수, 분석 결과
     error_occurred = pyqtSignal(str)
     
@@ -49,9 +437,39 @@ class CaptureThread(QThread):
             super().__init__()
             self.monitor_number = monitor_number
             self.running = False
-            self.capture_interval = 1000  # 1초마다 캡쳐
+            self.capture_interval = 1000  # 1초마다 캡쳐 (감지 시간대 기준)
             self.test_mode_active = False  # 테스트 모드 플래그
 
+            self.preview_size = (960, 540)  # 미리보기용 프레임 최대 크기 (set_preview_size로 갱신)
+            self.preview_active = True      # 미리보기가 화면에 보이는지 (아니면 시각화/전송 생략)
+            self.detection_enabled = True   # False면 분석 없이 원본 프레임만 전달 (교시 캡처 목표 달성 시)
+
+            # 스케줄 상태에 따른 캡쳐 간격 조절 (메인 윈도우가 set_schedule_state로 갱신)
+            self.in_class = True          # 수업 시간 여부
+            self.capture_active = True    # 감지 시간대이며 캡처 목표 미달 여부
+            self._wake_event = threading.Event()
+            self._frame_buf = None  # 매 캡쳐마다 재사용하는 화면 버퍼 (모니터 변경 시 초기화)
+            self._gray_buf = None   # 분석용 그레이스케일 버퍼 (크기가 같으면 재사용)
+            self._stop_event = threading.Event()  # stop() 호출 시 설정 - 모든 대기를 즉시 중단
+
+            # Zoom 갤러리 영역 (x, y, w, h) - 이 영역만 잘라서 분석, None이면 전체 화면
+            self.zoom_roi = None
+            self._roi_participants = 0   # ROI 계산 당시 참가자 수
+            self._roi_frame_count = 0    # ROI 사용 프레임 수 (주기적으로 전체 화면 재탐색)
+
+            # 정적인 화면에서 분석 결과 재사용 (64x64 썸네일 차이로 변화 판단)
+            self._prev_thumb = None
+            self._cached_analysis = None  # (분석 결과, 총 참가자 수, 얼굴 감지 수)
+            self._frames_since_detect = 0
+
+            # 분석 결과가 바뀐 경우에만 analysis_ready 전송
+            self._last_analysis_key = None
+            self._analysis_skips = 0
+
+            # 요약 정보용 시각 문자열 (초가 바뀔 때만 다시 포맷)
+            self._last_sec_key = -1
+            self._last_sec_str = ""
+
             self.logger = logging.getLogger(__name__)
             self.logger.info(f"=== CaptureThread 초기화 시작: 모니터 {monitor_number} ===")
 
@@ -65,20 +483,14 @@ class CaptureThread(QThread):
                 self.logger.error(f"✗ 화면 캡쳐 모듈 초기화 실패: {e}", exc_info=True)
                 raise Exception(f"화면 캡쳐 초기화 실패: {e}")
 
-            # Zoom 감지 모듈 초기화
+            # Zoom 감지 모듈은 run()에서 초기화 (모델 다운로드/로드가 GUI 스레드를 막지 않도록)
             self.zoom_detector = None
-            try:
-                from zoom_detector import ZoomParticipantDetector
-                self.zoom_detector = ZoomParticipantDetector()
-                self.logger.info("✓ Zoom 감지 모듈 초기화 완료")
-            except Exception as e:
-                self.logger.error(f"✗ Zoom 감지 모듈 초기화 실패: {e}", exc_info=True)
-                # Zoom 감지는 선택사항으로 처리
+            self._preload_model = False  # set_test_mode가 요청하면 캡쳐 스레드에서 모델 미리 로드
 
             # 시각화 모듈 초기화
             self.visualizer = None
             try:
-                from visualizer import RealTimeVisualizer
+                from zoom_detector import RealTimeVisualizer
                 self.visualizer = RealTimeVisualizer()
                 self.logger.info("✓ 시각화 모듈 초기화 완료")
             except Exception as e:
@@ -104,73 +516,351 @@ class CaptureThread(QThread):
             self.logger.error("screen_capturer가 None입니다")
             return
 
+        self._init_zoom_detector()
+
         while self.running:
             try:
+                # 테스트 모드 전환 시 요청된 모델 미리 로드 (캡쳐 스레드에서 수행)
+                if self._preload_model:
+                    self._preload_model = False
+                    face_detector = getattr(self.zoom_detector, 'face_detector', None)
+                    if face_detector is not None:
+                        face_detector._load_model()
+
                 # 화면 캡쳐 (srcdc 오류 방지를 위한 추가 예외 처리)
                 try:
-                    screenshot = self.screen_capturer.capture_screen()
+                    screenshot = self.screen_capturer.capture_screen(out=self._frame_buf)
                 except Exception as capture_error:
                     self.logger.warning(f"화면 캡쳐 일시 실패, 재시도: {capture_error}")
                     self.error_occurred.emit(f"화면 캡쳐 실패: {capture_error}")
-                    self.msleep(500)  # 0.5초 대기 후 재시도
+                    if self._sleep(500):  # 0.5초 대기 후 재시도
+                        break
                     continue
 
                 if screenshot is not None and screenshot.size > 0:
+                    self._frame_buf = screenshot
                     try:
-                        # zoom_detector가 None이면 건너뛰기
-                        if self.zoom_detector is None or self.visualizer is None:
+                        # zoom_detector가 None이거나 교시 캡처 목표 달성 시 분석 건너뛰기
+                        if (self.zoom_detector is None or self.visualizer is None or
+                                not self.detection_enabled):
                             # 원본 화면만 표시
-                            self.frame_ready.emit(screenshot)
+                            if self.preview_active:
+                                self._emit_preview(screenshot)
                             self.original_frame_ready.emit(screenshot)
-                            self.msleep(self.capture_interval)
+                            if self._sleep(self.compute_interval()):
+                                break
                             continue
 
-                        # 항상 얼굴 탐지 활성화
-                        if hasattr(self.zoom_detector, 'face_detector') and self.zoom_detector.face_detector:
-                            self.zoom_detector.face_detector._load_model()
-
-                        # Zoom 참가자 분석 (항상 얼굴 감지 활성화)
-                        analysis_results, total_participants, face_detected = \
-                            self.zoom_detector.detect_and_analyze_all(screenshot, force_detection=True)
-
-                        # 시각화 적용
-                        visualized_frame = self.visualizer.draw_participant_boxes(
-                            screenshot, analysis_results
-                        )
-                        visualized_frame = self.visualizer.draw_summary_info(
-                            visualized_frame, total_participants, face_detected,
-                            datetime.now().strftime("%H:%M:%S")
-                        )
+                        if self._is_scene_static(screenshot):
+                            # 화면 변화가 거의 없으면 이전 분석 결과 재사용
+                            analysis_results, total_participants, face_detected = self._cached_analysis
+                            self._frames_since_detect += 1
+                        else:
+                            analysis_results, total_participants, face_detected = \
+                                self._analyze_frame(screenshot)
+                            self._cached_analysis = (analysis_results, total_participants, face_detected)
+                            self._frames_since_detect = 0
+
+                        # 시각화 적용 (미리보기가 보이는 경우만)
+                        if self.preview_active:
+                            visualized_frame = self.visualizer.draw_participant_boxes(
+                                screenshot, analysis_results
+                            )
+                            visualized_frame = self.visualizer.draw_summary_info(
+                                visualized_frame, total_participants, face_detected,
+                                self._time_string()
+                            )
+                            self._emit_preview(visualized_frame)  # UI 표시용 (시각화 포함, 축소)
 
                         # 시그널 발송
-                        self.frame_ready.emit(visualized_frame)  # UI 표시용 (시각화 포함)
                         self.original_frame_ready.emit(screenshot)  # 캡쳐 저장용 (원본)
-                        self.analysis_ready.emit(total_participants, face_detected, analysis_results)
+                        self._emit_analysis(total_participants, face_detected, analysis_results)
 
                     except Exception as analysis_error:
                         self.logger.error(f"분석 중 오류: {analysis_error}", exc_info=True)
                         self.error_occurred.emit(f"분석 오류: {analysis_error}")
-                        # 분석 실패해도 원본 프레임은 표시
-                        self.frame_ready.emit(screenshot)
+                        # 분석 실패해도 원본 프레임은 표시 (미리보기가 보일 때만)
+                        if self.preview_active:
+                            self._emit_preview(screenshot)
                         self.original_frame_ready.emit(screenshot)
 
-                # 지정된 간격만큼 대기
-                self.msleep(self.capture_interval)
+                # 스케줄 상태에 맞는 간격만큼 대기
+                if self._sleep(self.compute_interval()):
+                    break
 
             except Exception as e:
                 self.logger.error(f"캡쳐 스레드 오류: {e}", exc_info=True)
                 self.error_occurred.emit(f"스레드 오류: {e}")
-                self.msleep(5000)  # 오류 시 5초 대기
+                if self._sleep(5000):  # 오류 시 5초 대기
+                    break
     
+    def set_test_mode(self, active: bool):
+        """
+        테스트 모드 설정 (수업 시간과 관계없이 짧은 간격으로 캡쳐 및 분석)
+
+        테스트 모드로 전환될 때 한 번만 얼굴 탐지 모델을 미리 로드
+
+        Args:
+            active (bool): 테스트 모드 활성화 여부
+        """
+        if active and not self.test_mode_active:
+            # 실제 로드는 캡쳐 스레드 루프에서 (GUI 스레드에서 모델 다운로드/로드 방지)
+            self._preload_model = True
+        self.test_mode_active = active
+
+    def _init_zoom_detector(self):
+        """
+        Zoom 감지 모듈 초기화 (캡쳐 스레드에서 호출 - FaceDetector 생성 시 모델 다운로드/로드 포함)
+        """
+        if self.zoom_detector is not None:
+            return
+        try:
+            from zoom_detector import ZoomParticipantDetector
+            self.zoom_detector = ZoomParticipantDetector()
+            self.logger.info("✓ Zoom 감지 모듈 초기화 완료")
+        except Exception as e:
+            self.logger.error(f"✗ Zoom 감지 모듈 초기화 실패: {e}", exc_info=True)
+            # Zoom 감지는 선택사항으로 처리
+
+    def set_preview_size(self, width: int, height: int):
+        """
+        미리보기 라벨 크기 설정 (frame_ready로 보내는 프레임을 이 크기에 맞게 축소)
+
+        Args:
+            width (int): 라벨 너비
+            height (int): 라벨 높이
+        """
+        if width > 0 and height > 0:
+            self.preview_size = (width, height)
+
+    def set_preview_active(self, active: bool):
+        """
+        미리보기 표시 여부 설정 (보이지 않으면 시각화 및 frame_ready 전송 생략)
+
+        Args:
+            active (bool): 미리보기가 화면에 보이는지 여부
+        """
+        self.preview_active = active
+
+    def _emit_preview(self, frame: np.ndarray):
+        """
+        미리보기 라벨 크기로 축소한 프레임을 frame_ready로 전달
+        (PREVIEW_IMAGE_FORMAT 채널 순서로 보냄 - BGR, 구버전 Qt는 RGB)
+
+        Args:
+            frame (np.ndarray): 전체 해상도 프레임 (BGR)
+        """
+        h, w = frame.shape[:2]
+        target_w, target_h = _fit_size(w, h, *self.preview_size)
+        owned = True  # 미리보기 전용 배열인지 (제자리 색 변환 가능 여부)
+        if (target_w, target_h) != (w, h):
+            frame = cv2.resize(frame, (target_w, target_h),
+                               interpolation=_resize_interpolation(w, target_w))
+        elif frame is self._frame_buf and not PREVIEW_NEEDS_RGB:
+            # 캡쳐 버퍼는 다음 캡쳐에 덮어쓰이므로 미리보기용 사본 전달
+            frame = frame.copy()
+        else:
+            owned = False
+
+        if PREVIEW_NEEDS_RGB:
+            # 색 변환이 곧 사본 생성이므로 원본 프레임은 건드리지 않음
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame if owned else None)
+        self.frame_ready.emit(frame)
+
+    def compute_interval(self) -> int:
+        """
+        스케줄 상태에 맞는 캡쳐 간격 계산
+
+        Returns:
+            int: 다음 캡쳐까지 대기 시간 (밀리초)
+        """
+        if self.test_mode_active or self.capture_active:
+            return self.capture_interval
+        if self.in_class:
+            return CLASS_CAPTURE_INTERVAL_MS
+        return IDLE_CAPTURE_INTERVAL_MS
+
+    def set_schedule_state(self, in_class: bool, capture_active: bool):
+        """
+        스케줄 상태 갱신 (GUI 스레드에서 호출)
+
+        더 짧은 간격이 필요한 상태로 바뀌면 대기 중인 스레드를 즉시 깨움
+
+        Args:
+            in_class (bool): 수업 시간 여부
+            capture_active (bool): 감지 시간대이며 캡처 목표 미달 여부
+        """
+        previous_interval = self.compute_interval()
+        self.in_class = in_class
+        self.capture_active = capture_active
+
+        if self.compute_interval() < previous_interval:
+            self.wake()
+
+    def wake(self):
+        """
+        대기 중인 캡쳐 루프를 즉시 깨움
+        """
+        self._wake_event.set()
+
+    def _sleep(self, interval_ms: int) -> bool:
+        """
+        지정 시간 대기 (wake() 또는 stop() 호출 시 즉시 반환)
+
+        Args:
+            interval_ms (int): 대기 시간 (밀리초)
+
+        Returns:
+            bool: 스레드 중지가 요청되었으면 True
+        """
+        self._wake_event.wait(interval_ms / 1000)
+        self._wake_event.clear()
+        return self._stop_event.is_set()
+
+    def _analyze_frame(self, screenshot: np.ndarray):
+        """
+        Zoom 갤러리 영역(ROI)에서 참가자/얼굴 분석
+
+        Args:
+            screenshot (np.ndarray): 전체 화면 프레임
+
+        Returns:
+            Tuple[list, int, int]: (전체 화면 좌표 기준 분석 결과, 총 참가자 수, 얼굴 감지 수)
+        """
+        # Zoom 갤러리 영역만 분석 (numpy view, 복사 없음)
+        if self.zoom_roi is not None:
+            roi_x, roi_y, roi_w, roi_h = self.zoom_roi
+            analysis_input = screenshot[roi_y:roi_y + roi_h, roi_x:roi_x + roi_w]
+        else:
+            roi_x, roi_y = 0, 0
+            analysis_input = screenshot
+
+        # 박스 감지/밝기 분석용 그레이스케일은 한 번만 변환 (얼굴 감지는 컬러 사용)
+        # 분석 안에서만 쓰이므로 프레임마다 새로 할당하지 않고 버퍼에 기록
+        gray_shape = analysis_input.shape[:2]
+        if self._gray_buf is None or self._gray_buf.shape != gray_shape:
+            self._gray_buf = np.empty(gray_shape, np.uint8)
+        gray = cv2.cvtColor(analysis_input, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+
+        # Zoom 참가자 분석 (항상 얼굴 감지 활성화)
+        analysis_results, total_participants, face_detected = \
+            self.zoom_detector.detect_and_analyze_all(analysis_input, force_detection=True, gray=gray)
+
+        # ROI 기준 좌표를 전체 화면 좌표로 변환
+        if roi_x or roi_y:
+            for analysis in analysis_results:
+                x, y, w, h = analysis['bbox']
+                analysis['bbox'] = (x + roi_x, y + roi_y, w, h)
+
+        self._update_zoom_roi(screenshot.shape, analysis_results, total_participants)
+        return analysis_results, total_participants, face_detected
+
+    def _time_string(self) -> str:
+        """
+        현재 시각 문자열 (HH:MM:SS) - 같은 초 안에서는 캐시 재사용
+
+        Returns:
+            str: 현재 시각 문자열
+        """
+        sec = int(time.time())
+        if sec != self._last_sec_key:
+            self._last_sec_key = sec
+            self._last_sec_str = datetime.fromtimestamp(sec).strftime("%H:%M:%S")
+        return self._last_sec_str
+
+    def _emit_analysis(self, total_participants: int, face_detected: int, analysis_results: list):
+        """
+        분석 결과가 이전과 다를 때만 analysis_ready 전송 (스레드 간 리스트 전달 비용 절감)
+
+        결과가 계속 같아도 ANALYSIS_FORCE_EMIT_EVERY 프레임마다 한 번은 전송
+
+        Args:
+            total_participants (int): 총 참가자 수
+            face_detected (int): 얼굴 감지 수
+            analysis_results (list): 분석 결과
+        """
+        key = (total_participants, face_detected,
+               tuple((a['bbox'], a['has_face']) for a in analysis_results))
+        if key == self._last_analysis_key and self._analysis_skips + 1 < ANALYSIS_FORCE_EMIT_EVERY:
+            self._analysis_skips += 1
+            return
+
+        self._last_analysis_key = key
+        self._analysis_skips = 0
+        self.analysis_ready.emit(total_participants, face_detected, analysis_results)
+
+    def _is_scene_static(self, screenshot: np.ndarray) -> bool:
+        """
+        이전 프레임 대비 화면 변화가 거의 없는지 확인
+
+        일정 프레임마다 강제로 False를 반환하여 재탐지
+
+        Args:
+            screenshot (np.ndarray): 현재 프레임
+
+        Returns:
+            bool: 이전 분석 결과를 재사용해도 되면 True
+        """
+        thumb = cv2.cvtColor(
+            cv2.resize(screenshot, (STATIC_THUMB_SIZE, STATIC_THUMB_SIZE), interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2GRAY
+        )
+        prev_thumb = self._prev_thumb
+        self._prev_thumb = thumb
+
+        if prev_thumb is None or self._cached_analysis is None:
+            return False
+        if self._frames_since_detect + 1 >= FORCE_DETECT_EVERY:
+            return False
+
+        return cv2.absdiff(thumb, prev_thumb).mean() < STATIC_DIFF_THRESHOLD
+
+    def _update_zoom_roi(self, frame_shape, analysis_results: list, total_participants: int):
+        """
+        참가자 박스들을 감싸는 분석 영역(ROI) 갱신
+
+        참가자 수가 줄거나 일정 프레임이 지나면 전체 화면을 다시 탐색
+
+        Args:
+            frame_shape: 전체 화면 프레임 shape
+            analysis_results (list): 전체 화면 좌표 기준 분석 결과
+            total_participants (int): 총 참가자 수
+        """
+        if self.zoom_roi is not None:
+            self._roi_frame_count += 1
+            if (total_participants < self._roi_participants or
+                    self._roi_frame_count >= ROI_REFRESH_FRAMES):
+                self.zoom_roi = None
+            return
+
+        if not analysis_results:
+            return
+
+        # 모든 참가자 박스의 외곽 영역 + 여백
+        frame_h, frame_w = frame_shape[:2]
+        x1 = min(a['bbox'][0] for a in analysis_results) - ROI_MARGIN
+        y1 = min(a['bbox'][1] for a in analysis_results) - ROI_MARGIN
+        x2 = max(a['bbox'][0] + a['bbox'][2] for a in analysis_results) + ROI_MARGIN
+        y2 = max(a['bbox'][1] + a['bbox'][3] for a in analysis_results) + ROI_MARGIN
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(frame_w, x2), min(frame_h, y2)
+
+        self.zoom_roi = (x1, y1, x2 - x1, y2 - y1)
+        self._roi_participants = total_participants
+        self._roi_frame_count = 0
+
     def stop(self):
         """
         스레드 중지
         """
         self.running = False
-        # 스크린 캡처 리소스 정리
+        # 대기 중인 루프를 즉시 깨워서 종료 (최대 대기 시간만큼 기다리지 않음)
+        self._stop_event.set()
+        self._wake_event.set()
+        self.wait()
+        # 스크린 캡처 리소스 정리 (루프 종료 후 - 캡쳐 도중 해제 방지)
         if hasattr(self, 'screen_capturer'):
             self.screen_capturer.cleanup()
-        self.wait()
     
     def set_capture_interval(self, interval_ms: int):
         """
@@ -194,11 +884,16 @@ class CaptureThread(QThread):
         
         self.monitor_number = monitor_number
         self.screen_capturer = ScreenCapture(monitor_number)
+        self._frame_buf = None
+        self._gray_buf = None
 
 class ZoomAttendanceMainWindow(QMainWindow):
     """
     메인 윈도우 클래스
     """
+
+    # 캡쳐 스레드에서 새 미리보기 프레임이 도착했음을 GUI 스레드에 알림 (갱신 예약당 1회)
+    preview_requested = pyqtSignal()
     
     def __init__(self):
         super().__init__()
@@ -213,6 +908,12 @@ class ZoomAttendanceMainWindow(QMainWindow):
         
         # 스케줄러는 나중에 초기화
         self.scheduler = None
+
+        # 스케줄러가 없을 때 교시 확인용으로 재사용하는 스케줄러 (실제 스케줄러 생성 시 폐기)
+        self._schedule_probe = ClassScheduler(capture_callback=None)
+
+        # 교시 시간표 (고정값이므로 시작 시 한 번만 읽음)
+        self._class_schedule = self._schedule_probe.class_schedule
         self.capture_thread = None
         
         # 현재 상태 변수
@@ -220,10 +921,36 @@ class ZoomAttendanceMainWindow(QMainWindow):
         self.is_monitoring = False
         self.total_participants = 0
         self.face_detected_count = 0
-        self.current_original_frame = None  # 캡쳐용 원본 프레임 저장
-        
-        # UI 라벨 초기화 (안전을 위한 기본값)
+        # 캡쳐용 원본 프레임 버퍼 풀 (최신 프레임과 저장 중인 프레임이 참조 수로 버퍼를 공유)
+        self._slab_pool = queue.SimpleQueue()   # 재사용 대기 중인 프레임 버퍼
+        self._slab_refs = {}                    # {id(버퍼): 참조 수}
+        self._slab_lock = threading.Lock()      # 스케줄러 스레드와 GUI 스레드 간 참조 수 보호
+        self._latest_slab = None                # current_original_frame으로 노출되는 최신 버퍼
+        self._pending_saves = {}                # {저장 경로: 저장 중인 버퍼}
+        
+        # UI 라벨 초기화 (안전을 위한 기본값, 실제 생성되지 않는 위젯도 None으로 유지)
         self.status_labels = None
+        self.preview_label = None
+        self.screen_label = None
+        self.participant_count_label = None
+        self.face_count_label = None
+        self.face_indicator = None
+        self.participant_indicator = None
+        self.detection_group = None
+        self.face_count_spinbox = None
+        self.duration_spinbox = None
+        self._face_state = None  # 얼굴 감지 인디케이터에 마지막으로 적용한 상태
+        self._last_analysis = None  # 마지막으로 표시한 (참가자 수, 감지 수, 필요 학생 수)
+        self._label_texts = {}      # {라벨: 마지막으로 설정한 텍스트} - 값이 같으면 setText 생략
+        self._last_class_state = None    # 마지막으로 표시한 (수업 여부, 교시) - 메인 탭 교시 라벨
+        self._last_status_date = None    # 마지막으로 표시한 날짜 - 메인 탭 날짜 라벨
+        self._last_monitor_state = None  # 마지막으로 표시한 (수업 여부, 교시) - 컨트롤 탭 교시 라벨
+
+        # 현재 초 캐시 - 1초 타이머들이 매번 datetime을 만들지 않도록 초가 바뀔 때만 갱신 (_clock)
+        self._clock_key = -1
+        self._clock_tm = None   # time.struct_time (로컬 시각)
+        self._clock_sec = 0     # 자정 기준 초
+        self._clock_str = ""    # "HH:MM:SS"
         
         # 교시별 캡처 관리
         self.period_capture_counts = {}  # {period: count} 각 교시별 캡처된 사진 수
@@ -233,10 +960,53 @@ class ZoomAttendanceMainWindow(QMainWindow):
         desktop = os.path.join(os.path.expanduser("~"), "Desktop")
         self.base_folder = os.path.join(desktop, "강의출석자동화")
         os.makedirs(self.base_folder, exist_ok=True)
+        self._ready_dirs = {self.base_folder}  # 이미 생성 확인된 폴더 (makedirs 중복 호출 방지)
+
+        # 캡쳐 저장 스레드 풀 (이미지 인코딩을 UI/스케줄러 스레드에서 분리)
+        self.save_pool = QThreadPool()
+        self.save_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        self.save_signals = _SaveSignals()
+        self.save_signals.finished.connect(self.on_capture_saved)
+        self._attendance_log_lock = threading.Lock()  # 출석 CSV 기록 작업 직렬화
+
+        # 설정 저장 디바운스 (연속 변경 시 마지막 변경 후 한 번만 저장)
+        self._save_debounce = QTimer(self)
+        self._save_debounce.setSingleShot(True)
+        self._save_debounce.setInterval(200)
+        self._save_debounce.timeout.connect(self.save_settings)
+
+        # 테스트 캡쳐 타이머 (10초 간격 3장)
+        self._test_shot_idx = 0
+        self._test_files = []
+        self._test_stop_thread = False
+        self._test_prev_mode = False  # 테스트 캡쳐 전 캡쳐 스레드의 테스트 모드 (완료 후 복원)
+        self._test_timer = QTimer(self)
+        self._test_timer.setTimerType(Qt.PreciseTimer)
+        self._test_timer.setInterval(10000)
+        self._test_timer.timeout.connect(self._test_capture_tick)
+
+        # 미리보기 갱신 합치기 (캡쳐 스레드가 최신 프레임 1장만 덮어쓰고 GUI 스레드가 가져감)
+        self._pending_preview = None
+        self._preview_scheduled = False
+        self._preview_mutex = QMutex()
+        self.preview_requested.connect(self._schedule_preview_flush)
+        self._preview_buf = None  # 미리보기 축소/색 변환용 재사용 버퍼
+        self._preview_qimage = None  # _preview_buf를 감싸는 QImage (버퍼 재할당 시에만 새로 생성)
+        self._last_paint = 0.0    # 마지막 미리보기 갱신 시각 (time.monotonic)
+        self._preview_visible = False  # 미리보기가 화면에 보이는지 (숨김/최소화/다른 탭이면 그리지 않음)
+        self._preview_fit = (None, None)  # ((프레임 크기, 라벨 크기), 맞춤 크기) 캐시
+        self._preview_timer = QTimer(self)  # 프레임 간격 제한용이라 기본 CoarseTimer로 충분
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._flush_preview)
 
         # 테스트 및 설정 변수
         self.test_detection_active = False
-        self.manual_detection_timer = None
+        # 수동 탐지 종료 타이머 (한 번만 만들고 시작할 때마다 재사용)
+        self.manual_detection_timer = QTimer(self)
+        self.manual_detection_timer.setTimerType(Qt.PreciseTimer)
+        self.manual_detection_timer.setSingleShot(True)
+        self.manual_detection_timer.timeout.connect(self.stop_manual_detection)
+
         self.settings = QSettings('ZoomAttendance', 'Settings')
         
         # 기본 설정값
@@ -259,6 +1029,10 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 촬영 상태 추적
         self.current_attempt = 0         # 현재 시도 번호
         self.attempt_results = {}        # {period: [attempt1_result, attempt2_result, ...]}
+
+        # 교시별 캡처 시간대 (load_settings에서 계산)
+        self._capture_windows = {}       # {period: (시작 초, 종료 초)} 스케줄 캡처 (35~40분)
+        self._live_bounds = (np.empty(0, np.int32), np.empty(0, np.int32))  # 실시간 감지 (시작 분 ~ 교시 종료) 배열
         
         # UI 초기화
         self.init_ui()
@@ -296,6 +1070,12 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 탭 생성
         self.create_main_tab()      # 메인 모니터링
         self.create_settings_tab()  # 설정
+
+        # 메인 탭이 아닐 때는 캡쳐 스레드의 시각화 생략
+        self.tab_widget.currentChanged.connect(self._update_preview_active)
+
+        # 실시간 갱신 대상 라벨은 모두 위 탭 생성 과정에서 만들어짐 (갱신 시 존재 확인 생략)
+        assert all(getattr(self, name, None) is not None for name in REALTIME_LABELS)
     
     def create_main_tab(self):
         """
@@ -348,7 +1128,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         
         self.current_class_label = QLabel("수업 시간 아님")
         self.current_class_label.setAlignment(Qt.AlignCenter)
-        self.current_class_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #FF5722;")
+        self.current_class_label.setStyleSheet(CLASS_LABEL_STYLES['idle'])
         class_layout.addWidget(self.current_class_label)
         
         layout.addWidget(class_group)
@@ -356,6 +1136,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 감지 상태 표시
         detection_group = QGroupBox("👥 얼굴 감지 상태")
         detection_group.setMinimumWidth(250)
+        self.detection_group = detection_group  # update_analysis에서 라벨 갱신을 한 번에 그리기 위해 보관
         detection_layout = QVBoxLayout(detection_group)
         detection_layout.setContentsMargins(10, 20, 10, 15)
 
@@ -467,7 +1248,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 모니터링 시작 버튼 (스케줄러 통합)
         self.monitor_btn = QPushButton("모니터링 시작")
         self.monitor_btn.clicked.connect(self.toggle_monitoring)
-        self.monitor_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 14px; padding: 10px; font-weight: bold; }")
+        self.monitor_btn.setStyleSheet(BUTTON_STATES['monitor_off'][1])
         control_layout.addWidget(self.monitor_btn)
 
         # 테스트 캡쳐 버튼 (30초간 3장 고정)
@@ -510,12 +1291,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setMinimumSize(640, 360)
         self.preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f5f5f5; color: #666; font-size: 16px;")
+        self.preview_label.installEventFilter(self)  # 크기 변경 시 캡쳐 스레드에 미리보기 크기 전달
         preview_layout.addWidget(self.preview_label)
 
         # 캡쳐 진행상황 표시
         self.capture_progress_label = QLabel("")
         self.capture_progress_label.setAlignment(Qt.AlignCenter)
-        self.capture_progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #4CAF50; padding: 10px;")
+        self.capture_progress_label.setStyleSheet(CAPTURE_PROGRESS_STYLES['done'])
         preview_layout.addWidget(self.capture_progress_label)
 
         layout.addWidget(preview_group)
@@ -701,14 +1483,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
         실시간 업데이트 타이머 시작
         """
         # 실시간 상태 업데이트 타이머 (1초마다)
+        # CoarseTimer(±5%)면 시계 표시가 가끔 1초를 건너뛰고 감지 시간대 경계가 늦게 반영됨
         self.status_timer = QTimer()
+        self.status_timer.setTimerType(Qt.PreciseTimer)
         self.status_timer.timeout.connect(self.update_realtime_status)
         self.status_timer.start(1000)  # 1초
-        
-        # 실시간 프리뷰 업데이트 타이머 (200ms마다)
-        self.preview_timer = QTimer()
-        self.preview_timer.timeout.connect(self.update_preview)
-        self.preview_timer.start(200)  # 200ms
+
+        # 미리보기는 CaptureThread.frame_ready 시그널로만 갱신 (폴링 타이머 없음)
     
     def update_realtime_status(self):
         """
@@ -716,33 +1497,38 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         try:
             # 현재 시간 업데이트
-            now = datetime.now()
-            current_time = now.strftime("%H:%M:%S")
-            current_date = now.strftime("%Y년 %m월 %d일")
-            
-            # 시간 라벨 업데이트 (안전 확인)
-            if hasattr(self, 'current_time_label') and self.current_time_label:
-                self.current_time_label.setText(current_time)
-            if hasattr(self, 'current_date_label') and self.current_date_label:
-                self.current_date_label.setText(current_date)
+            self._clock()
+            tm = self._clock_tm
+            self.current_time_label.setText(self._clock_str)
+
+            # 날짜 라벨은 날짜가 바뀔 때만 업데이트
+            today = (tm.tm_year, tm.tm_mon, tm.tm_mday)
+            if today != self._last_status_date:
+                self._last_status_date = today
+                self.current_date_label.setText(f"{tm.tm_year}년 {tm.tm_mon:02d}월 {tm.tm_mday:02d}일")
             
             # 현재 교시 확인 (기존 스케줄러 사용)
-            if hasattr(self, 'scheduler') and self.scheduler:
+            if self.scheduler:
                 is_class, class_period = self.scheduler.is_class_time()
             else:
-                # 스케줄러가 없으면 임시 확인용 스케줄러 사용 (로깅 없이)
-                from scheduler import ClassScheduler
-                temp_scheduler = ClassScheduler(capture_callback=None)
-                is_class, class_period = temp_scheduler.is_class_time()
+                # 스케줄러가 없으면 확인용 스케줄러 재사용 (매초 새로 만들지 않음)
+                if self._schedule_probe is None:
+                    self._schedule_probe = ClassScheduler(capture_callback=None)
+                is_class, class_period = self._schedule_probe.is_class_time()
             
-            # 교시 라벨 업데이트 (안전 확인)
-            if hasattr(self, 'current_class_label') and self.current_class_label:
+            # 교시 라벨 업데이트 (상태가 바뀔 때만 - 스타일시트 재적용은 비용이 큼)
+            class_state = (is_class, class_period)
+            if class_state != self._last_class_state:
+                self._last_class_state = class_state
                 if is_class:
                     self.current_class_label.setText(f"{class_period}교시 진행중")
-                    self.current_class_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #4CAF50;")
+                    self.current_class_label.setStyleSheet(CLASS_LABEL_STYLES['class'])
                 else:
                     self.current_class_label.setText("수업 시간 아님")
-                    self.current_class_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #FF5722;")
+                    self.current_class_label.setStyleSheet(CLASS_LABEL_STYLES['idle'])
+
+            # 캡쳐 스레드 간격 조절 (수업/감지 시간대 전환 시 즉시 반영)
+            self._sync_capture_schedule(is_class)
 
             # 스케줄 진행상황 및 미리보기 카운트다운 업데이트
             self.update_schedule_progress()
@@ -758,48 +1544,25 @@ class ZoomAttendanceMainWindow(QMainWindow):
         try:
             # 모니터링이 꺼져있으면 대기 상태 표시
             if not self.is_monitoring:
-                if hasattr(self, 'schedule_current_label'):
-                    self.schedule_current_label.setText("모니터링 대기 중")
-                if hasattr(self, 'schedule_attempt_label'):
-                    self.schedule_attempt_label.setText("")
-                if hasattr(self, 'schedule_next_label'):
-                    self.schedule_next_label.setText("")
+                self.schedule_current_label.setText("모니터링 대기 중")
+                self.schedule_attempt_label.setText("")
+                self.schedule_next_label.setText("")
                 return
 
-            from scheduler import ClassScheduler
-            now = datetime.now()
-            current_time = now.time()
+            now_sec = self._clock()
+            now_min = now_sec // 60
+            starts, ends = self._live_bounds
+            idx, active = _locate_window(starts, ends, now_sec)
 
-            # 스케줄러가 있으면 사용, 없으면 임시 생성
-            if hasattr(self, 'scheduler') and self.scheduler:
-                class_schedule = self.scheduler.class_schedule
-            else:
-                temp_scheduler = ClassScheduler(capture_callback=None)
-                class_schedule = temp_scheduler.class_schedule
-
-            # 각 교시의 캡처 시간 확인 (설정된 시작 분부터)
-            for period, (start_time, end_time) in enumerate(class_schedule, 1):
-                # 설정된 시작 분 사용
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + self.capture_start_minute
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-
-                # 교시 종료 시간을 캡처 종료 시간으로 사용
-                capture_end_hour = end_time.hour
-                capture_end_minute = end_time.minute
-
-                from datetime import time
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = time(capture_end_hour, capture_end_minute)
+            if idx >= 0:
+                period = idx + 1
+                start_min = int(starts[idx]) // 60
+                end_min = int(ends[idx]) // 60
 
                 # 현재 캡처 시간 중인 경우
-                if capture_start <= current_time <= capture_end:
-                    elapsed_minutes = (current_time.hour * 60 + current_time.minute) - \
-                                    (capture_start_hour * 60 + capture_start_minute)
-                    remaining_minutes = (capture_end_hour * 60 + capture_end_minute) - \
-                                      (current_time.hour * 60 + current_time.minute)
+                if active:
+                    elapsed_minutes = now_min - start_min
+                    remaining_minutes = end_min - now_min
 
                     # 현재 교시의 캡처 시도 횟수 확인
                     current_attempts = self.period_capture_counts.get(period, 0)
@@ -808,276 +1571,191 @@ class ZoomAttendanceMainWindow(QMainWindow):
                     # 현재 시도 번호 계산 (1부터 시작)
                     current_try = self.current_attempt + 1
 
-                    if hasattr(self, 'schedule_current_label'):
-                        if self.detection_duration_mode == -1:
-                            # 실시간 감지 모드
-                            self.schedule_current_label.setText(
-                                f"📸 {period}교시 실시간 촬영 중 ({current_attempts}/{target_photos}장)"
-                            )
-                        else:
-                            # 시간제한 감지 모드
-                            self.schedule_current_label.setText(
-                                f"📸 {period}교시 {current_try}차 시도 ({current_attempts}/{target_photos}장)"
-                            )
-
-                    if hasattr(self, 'schedule_attempt_label'):
-                        self.schedule_attempt_label.setText(
-                            f"진행: {elapsed_minutes}분 경과 / {remaining_minutes}분 남음"
+                    if self.detection_duration_mode == -1:
+                        # 실시간 감지 모드
+                        self.schedule_current_label.setText(
+                            f"📸 {period}교시 실시간 촬영 중 ({current_attempts}/{target_photos}장)"
+                        )
+                    else:
+                        # 시간제한 감지 모드
+                        self.schedule_current_label.setText(
+                            f"📸 {period}교시 {current_try}차 시도 ({current_attempts}/{target_photos}장)"
                         )
 
-                    if hasattr(self, 'schedule_next_label'):
-                        if current_attempts >= target_photos:
+                    self.schedule_attempt_label.setText(
+                        f"진행: {elapsed_minutes}분 경과 / {remaining_minutes}분 남음"
+                    )
+
+                    if current_attempts >= target_photos:
+                        self.schedule_next_label.setText(
+                            f"✅ {period}교시 완료 (목표 달성)"
+                        )
+                    else:
+                        remaining_photos = target_photos - current_attempts
+                        if self.detection_duration_mode == -1:
                             self.schedule_next_label.setText(
-                                f"✅ {period}교시 완료 (목표 달성)"
+                                f"남은 목표: {remaining_photos}장 (실시간 감지 중)"
                             )
                         else:
-                            remaining_photos = target_photos - current_attempts
-                            if self.detection_duration_mode == -1:
-                                self.schedule_next_label.setText(
-                                    f"남은 목표: {remaining_photos}장 (실시간 감지 중)"
-                                )
-                            else:
-                                self.schedule_next_label.setText(
-                                    f"다음 시도: 얼굴 감지 시 자동 촬영 ({remaining_photos}장 필요)"
-                                )
+                            self.schedule_next_label.setText(
+                                f"다음 시도: 얼굴 감지 시 자동 촬영 ({remaining_photos}장 필요)"
+                            )
                     return
 
                 # 다가오는 캡처 시간인 경우
-                if current_time < capture_start:
-                    time_until_start = (capture_start_hour * 60 + capture_start_minute) - \
-                                     (current_time.hour * 60 + current_time.minute)
+                time_until_start = start_min - now_min
 
-                    if hasattr(self, 'schedule_current_label'):
-                        self.schedule_current_label.setText(
-                            f"⏰ 다음: {period}교시 ({time_until_start}분 후)"
-                        )
+                self.schedule_current_label.setText(
+                    f"⏰ 다음: {period}교시 ({time_until_start}분 후)"
+                )
 
-                    if hasattr(self, 'schedule_attempt_label'):
-                        self.schedule_attempt_label.setText(
-                            f"촬영 시작: {capture_start_hour:02d}:{capture_start_minute:02d}"
-                        )
+                self.schedule_attempt_label.setText(
+                    f"촬영 시작: {start_min // 60:02d}:{start_min % 60:02d}"
+                )
 
-                    if hasattr(self, 'schedule_next_label'):
-                        if self.detection_duration_mode == -1:
-                            mode_text = "실시간 감지"
-                        elif self.detection_duration_mode == 60:
-                            mode_text = "1분간 진행"
-                        else:
-                            mode_text = "30초간 진행"
+                if self.detection_duration_mode == -1:
+                    mode_text = "실시간 감지"
+                elif self.detection_duration_mode == 60:
+                    mode_text = "1분간 진행"
+                else:
+                    mode_text = "30초간 진행"
 
-                        retry_text = ""
-                        if self.retry_count > 0:
-                            retry_text = f", 최대 {self.retry_count}회 재시도"
+                retry_text = ""
+                if self.retry_count > 0:
+                    retry_text = f", 최대 {self.retry_count}회 재시도"
 
-                        self.schedule_next_label.setText(
-                            f"목표 {self.target_photo_count}장 ({mode_text}{retry_text})"
-                        )
-                    return
+                self.schedule_next_label.setText(
+                    f"목표 {self.target_photo_count}장 ({mode_text}{retry_text})"
+                )
+                return
 
             # 오늘 모든 스케줄 종료
-            if hasattr(self, 'schedule_current_label'):
-                self.schedule_current_label.setText("📅 오늘 스케줄 종료")
-            if hasattr(self, 'schedule_attempt_label'):
-                total_captures = sum(self.period_capture_counts.values())
-                self.schedule_attempt_label.setText(
-                    f"총 {total_captures}장 촬영 완료"
-                )
-            if hasattr(self, 'schedule_next_label'):
-                self.schedule_next_label.setText("내일 다시 시작됩니다")
+            self.schedule_current_label.setText("📅 오늘 스케줄 종료")
+            total_captures = sum(self.period_capture_counts.values())
+            self.schedule_attempt_label.setText(
+                f"총 {total_captures}장 촬영 완료"
+            )
+            self.schedule_next_label.setText("내일 다시 시작됩니다")
 
         except Exception as e:
             self.logger.error(f"스케줄 진행상황 업데이트 오류: {e}")
-            if hasattr(self, 'schedule_current_label'):
-                self.schedule_current_label.setText("진행상황 확인 오류")
+            self.schedule_current_label.setText("진행상황 확인 오류")
 
-    def _is_in_capture_window(self) -> bool:
+    def _current_live_period(self) -> int:
         """
-        현재 시간이 스케줄 감지 시간 내인지 확인
+        현재 실시간 감지 시간대인 교시 확인
 
         Returns:
-            bool: 감지 시간이면 True, 아니면 False
+            int: 감지 시간대인 교시 번호, 아니면 0
         """
-        try:
-            from scheduler import ClassScheduler
-            from datetime import time
-
-            # 임시 스케줄러로 교시 확인
-            temp_scheduler = ClassScheduler(capture_callback=None)
-            now = datetime.now()
-            current_time = now.time()
-            class_schedule = temp_scheduler.class_schedule
-
-            # 각 교시의 캡처 시간 확인
-            for period, (start_time, end_time) in enumerate(class_schedule, 1):
-                # 설정된 시작 분 사용
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + self.capture_start_minute
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = end_time
+        idx, active = _locate_window(*self._live_bounds, self._clock())
+        return idx + 1 if active else 0
 
-                # 현재 캡처 시간 중인 경우
-                if capture_start <= current_time <= capture_end:
-                    return True
+    def _clock(self) -> int:
+        """
+        현재 로컬 시각을 자정 기준 초로 반환 - 같은 초 안에서는 캐시 재사용
+        (_clock_tm, _clock_str도 함께 갱신)
 
-            return False
+        Returns:
+            int: 자정 기준 초
+        """
+        key = int(time.time())
+        if key != self._clock_key:
+            self._clock_key = key
+            tm = time.localtime(key)
+            self._clock_tm = tm
+            self._clock_sec = tm.tm_hour * 3600 + tm.tm_min * 60 + tm.tm_sec
+            self._clock_str = f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        return self._clock_sec
 
-        except Exception as e:
-            self.logger.error(f"캡처 시간 확인 오류: {e}")
-            return False
+    def _sync_capture_schedule(self, is_class: bool = None):
+        """
+        캡쳐 스레드에 현재 스케줄 상태 전달 (수업 외 시간에는 캡쳐 간격을 늘림)
+
+        Args:
+            is_class (bool): 수업 시간 여부 (None이면 직접 확인)
+        """
+        if self.capture_thread is None:
+            return
+
+        if is_class is None:
+            is_class = any(start <= datetime.now().time() <= end
+                           for start, end in self._class_schedule)
+
+        period = self._current_live_period()
+        quota_reached = (period > 0 and
+                         self.period_capture_counts.get(period, 0) >= self.max_captures_per_period)
+        self.capture_thread.set_schedule_state(is_class, period > 0 and not quota_reached)
+
+        # 현재 교시 캡처가 끝났으면 분석 중단, 교시가 바뀌면 다시 활성화
+        # (테스트 모드/수동 탐지 중에는 목표 달성과 관계없이 분석 유지)
+        self.capture_thread.detection_enabled = self.capture_thread.test_mode_active or not quota_reached
+
+    def _set_capture_test_mode(self, active: bool):
+        """
+        캡쳐 스레드 테스트 모드 설정 후 분석 여부(교시 목표 달성 시 중단) 다시 계산
+
+        Args:
+            active (bool): 테스트 모드 활성화 여부
+        """
+        if self.capture_thread is None:
+            return
+        self.capture_thread.set_test_mode(active)
+        self._sync_capture_schedule()
+
+    def _is_in_capture_window(self) -> bool:
+        """
+        현재 시간이 스케줄 감지 시간 내인지 확인
+
+        Returns:
+            bool: 감지 시간이면 True, 아니면 False
+        """
+        return self._current_live_period() > 0
 
     def update_preview_countdown(self):
         """
         미리보기 화면에 카운트다운 또는 캡쳐 진행상황 표시
         """
         try:
-            if not hasattr(self, 'capture_progress_label'):
-                return
-
             # 모니터링이 꺼져있으면 표시하지 않음
             if not self.is_monitoring:
                 self.capture_progress_label.setText("")
                 return
 
-            from scheduler import ClassScheduler
-            from datetime import time
-
-            # 임시 스케줄러로 교시 확인
-            temp_scheduler = ClassScheduler(capture_callback=None)
-            now = datetime.now()
-            current_time = now.time()
-            class_schedule = temp_scheduler.class_schedule
-
-            # 각 교시의 캡처 시간 확인
-            for period, (start_time, end_time) in enumerate(class_schedule, 1):
-                # 설정된 시작 분 사용
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + self.capture_start_minute
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = end_time
+            now_sec = self._clock()
+            starts, ends = self._live_bounds
+            idx, active = _locate_window(starts, ends, now_sec)
 
-                # 현재 캡처 시간 중인 경우
-                if capture_start <= current_time <= capture_end:
-                    # 캡쳐 진행상황 표시
-                    current_count = self.period_capture_counts.get(period, 0)
-                    target_count = self.target_photo_count
-
-                    if current_count >= target_count:
-                        self.capture_progress_label.setText(f"✅ {period}교시 완료 ({current_count}/{target_count}장)")
-                        self.capture_progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #4CAF50; padding: 10px;")
-                    else:
-                        self.capture_progress_label.setText(f"📸 캡쳐 진행 중: {current_count}/{target_count}장")
-                        self.capture_progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #2196F3; padding: 10px;")
-                    return
+            # 현재 캡처 시간 중인 경우
+            if active:
+                # 캡쳐 진행상황 표시
+                period = idx + 1
+                current_count = self.period_capture_counts.get(period, 0)
+                target_count = self.target_photo_count
 
-                # 다가오는 캡처 시간인 경우 (카운트다운)
-                if current_time < capture_start:
-                    total_seconds = (capture_start_hour * 3600 + capture_start_minute * 60) - \
-                                  (current_time.hour * 3600 + current_time.minute * 60 + current_time.second)
+                if current_count >= target_count:
+                    self.capture_progress_label.setText(f"✅ {period}교시 완료 ({current_count}/{target_count}장)")
+                    self._set_label_style(self.capture_progress_label, CAPTURE_PROGRESS_STYLES['done'])
+                else:
+                    self.capture_progress_label.setText(f"📸 캡쳐 진행 중: {current_count}/{target_count}장")
+                    self._set_label_style(self.capture_progress_label, CAPTURE_PROGRESS_STYLES['capturing'])
+                return
 
-                    minutes = total_seconds // 60
-                    seconds = total_seconds % 60
+            # 다가오는 캡처 시간인 경우 (카운트다운)
+            if idx >= 0:
+                minutes, seconds = divmod(int(starts[idx]) - now_sec, 60)
 
-                    self.capture_progress_label.setText(f"⏰ 다음 감지까지 {minutes:02d}분 {seconds:02d}초 남음")
-                    self.capture_progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #FF9800; padding: 10px;")
-                    return
+                self.capture_progress_label.setText(f"⏰ 다음 감지까지 {minutes:02d}분 {seconds:02d}초 남음")
+                self._set_label_style(self.capture_progress_label, CAPTURE_PROGRESS_STYLES['countdown'])
+                return
 
             # 모든 스케줄 종료
             self.capture_progress_label.setText("📅 오늘 스케줄 종료")
-            self.capture_progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #999; padding: 10px;")
+            self._set_label_style(self.capture_progress_label, CAPTURE_PROGRESS_STYLES['finished'])
 
         except Exception as e:
             self.logger.error(f"미리보기 카운트다운 업데이트 오류: {e}")
 
-    def update_next_capture_time(self):
-        """
-        다음 자동 캡처 활성화 시간 업데이트
-        """
-        try:
-            # 기존 스케줄러 사용 또는 임시 스케줄러 생성
-            if hasattr(self, 'scheduler') and self.scheduler:
-                class_schedule = self.scheduler.class_schedule
-            else:
-                from scheduler import ClassScheduler
-                temp_scheduler = ClassScheduler(capture_callback=None)
-                class_schedule = temp_scheduler.class_schedule
-                
-            now = datetime.now()
-            current_time = now.time()
-            
-            # 각 교시의 35~40분 캡처 시간 확인 (5분간)
-            for period, (start_time, end_time) in enumerate(class_schedule, 1):
-                # 캡처 시작 시간 (교시 시작 + 35분)
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + 35
-                
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-                
-                # 캡처 종료 시간 (교시 시작 + 40분) - 5분간만
-                capture_end_hour = start_time.hour
-                capture_end_minute = start_time.minute + 40
-                
-                if capture_end_minute >= 60:
-                    capture_end_hour += 1
-                    capture_end_minute -= 60
-                
-                from datetime import time
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = time(capture_end_hour, capture_end_minute)
-                
-                # 현재 시간이 이 캡처 시간보다 앞에 있으면
-                if current_time < capture_start:
-                    if hasattr(self, 'next_capture_label') and self.next_capture_label:
-                        self.next_capture_label.setText(
-                            f"다음 자동캡처 활성화\n{period}교시 {capture_start_hour:02d}:{capture_start_minute:02d}~{capture_end_hour:02d}:{capture_end_minute:02d}"
-                        )
-                    return
-                
-                # 현재 캡처 시간 중이면
-                elif capture_start <= current_time <= capture_end:
-                    remaining_minutes = (capture_end_hour * 60 + capture_end_minute) - (current_time.hour * 60 + current_time.minute)
-                    if hasattr(self, 'next_capture_label') and self.next_capture_label:
-                        self.next_capture_label.setText(
-                            f"현재 자동캡처 활성화 중\n{period}교시 (종료까지 {remaining_minutes}분)"
-                        )
-                    return
-            
-            # 오늘 남은 캡처 시간이 없으면
-            if hasattr(self, 'next_capture_label') and self.next_capture_label:
-                self.next_capture_label.setText("오늘 예정된 자동캡처 없음")
-            
-        except Exception as e:
-            if hasattr(self, 'next_capture_label') and self.next_capture_label:
-                self.next_capture_label.setText("시간 계산 오류")
-            self.logger.error(f"다음 캡처 시간 계산 오류: {e}")
-    
-    def update_preview(self):
-        """
-        실시간 미리보기 업데이트
-        """
-        try:
-            if hasattr(self, 'capture_thread') and self.capture_thread and self.capture_thread.running:
-                # 캡처 스레드가 실행 중이면 프레임 업데이트는 시그널로 처리
-                pass
-            else:
-                # 모니터링이 중지된 상태면 기본 메시지 표시
-                if not hasattr(self, '_preview_default_set'):
-                    if hasattr(self, 'preview_label') and self.preview_label:
-                        self.preview_label.setText("모니터링을 시작하세요")
-                        self.preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f5f5f5; color: #666;")
-                    self._preview_default_set = True
-        except Exception as e:
-            self.logger.error(f"미리보기 업데이트 오류: {e}")
-    
     def toggle_main_monitoring(self):
         """
         메인 모니터링 및 자동스케줄 원버튼 토글
@@ -1086,15 +1764,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
             if hasattr(self, 'capture_thread') and self.capture_thread and self.capture_thread.running:
                 # 현재 실행 중이면 중지
                 self.stop_monitoring()
-                self.main_monitoring_btn.setText("🚀 모니터링 & 자동스케줄 시작")
-                self.main_monitoring_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 16px; padding: 15px; font-weight: bold; }")
+                self._apply_btn(self.main_monitoring_btn, 'main_off')
             else:
                 # 중지 상태면 시작
                 self.start_monitoring()
                 # 자동 스케줄러도 함께 시작
                 # TODO: 자동 스케줄러 시작 로직 추가
-                self.main_monitoring_btn.setText("🛑 모니터링 & 자동스케줄 중지")
-                self.main_monitoring_btn.setStyleSheet("QPushButton { background-color: #F44336; color: white; font-size: 16px; padding: 15px; font-weight: bold; }")
+                self._apply_btn(self.main_monitoring_btn, 'main_on')
                 
         except Exception as e:
             self.logger.error(f"메인 모니터링 토글 오류: {e}")
@@ -1109,6 +1785,11 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.save_settings(show_message=False)
             # 교시 설정 저장
             self.save_schedule_settings()
+            # 선택된 Zoom 모니터 저장 (다음 실행 시 자동 감지에서 먼저 확인)
+            selected_monitor = self.monitor_combo.currentData()
+            if selected_monitor is not None:
+                self.zoom_monitor = selected_monitor
+                self.settings.setValue('zoom_monitor', selected_monitor)
             # 통합 메시지
             QMessageBox.information(self, "저장 완료", "모든 설정이 저장되었습니다.")
         except Exception as e:
@@ -1122,12 +1803,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         try:
             selected_monitor = self.monitor_combo.currentData() if hasattr(self, 'monitor_combo') else 2
             
-            self.capture_thread = CaptureThread(selected_monitor)
-            self.capture_thread.frame_ready.connect(self.update_screen)
-            self.capture_thread.original_frame_ready.connect(self.store_original_frame)
-            self.capture_thread.analysis_ready.connect(self.update_analysis)
-            self.capture_thread.error_occurred.connect(self.handle_error)
-            
+            self._create_capture_thread(selected_monitor)
             self.capture_thread.start()
             self.logger.info("실시간 모니터링 시작")
             
@@ -1146,10 +1822,9 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.capture_thread = None
             
             # 미리보기 화면 초기화
-            if hasattr(self, 'preview_label') and self.preview_label:
+            if self.preview_label is not None:
                 self.preview_label.setText("모니터링을 시작하세요")
                 self.preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f5f5f5; color: #666;")
-                self._preview_default_set = True
             
             self.logger.info("실시간 모니터링 중지")
             
@@ -1174,23 +1849,12 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.log_text.clear()
                 
                 # 로그 파일에서 최근 50줄 읽기
-                log_file_path = 'zoom_attendance_gui.log'
+                log_file_path = GUI_LOG_FILE
                 if os.path.exists(log_file_path):
-                    with open(log_file_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        # 최근 50줄만 표시
-                        recent_lines = lines[-50:] if len(lines) > 50 else lines
-                        for line in recent_lines:
-                            # 시간 포맷 조정
-                            formatted_line = line.strip()
-                            if ' - ' in formatted_line:
-                                parts = formatted_line.split(' - ', 2)
-                                if len(parts) >= 3:
-                                    time_part = parts[0].split(' ')[1] if ' ' in parts[0] else parts[0]
-                                    level_part = parts[1]
-                                    msg_part = parts[2]
-                                    formatted_line = f"[{time_part}] {level_part} - {msg_part}"
-                            self.log_text.append(formatted_line)
+                    # 최근 50줄만 파일 끝에서 읽어 시간 포맷 조정 후 한 번에 추가
+                    lines = [_format_log_line(line) for line in _tail_lines(log_file_path, 50)]
+                    if lines:
+                        self.log_text.append("\n".join(lines))
                     
                     # 스크롤을 맨 아래로
                     cursor = self.log_text.textCursor()
@@ -1249,7 +1913,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 스케줄러 시작/중지 버튼
         self.scheduler_btn = QPushButton("자동 스케줄 시작")
         self.scheduler_btn.clicked.connect(self.toggle_scheduler)
-        self.scheduler_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-size: 14px; padding: 10px; }")
+        self.scheduler_btn.setStyleSheet(BUTTON_STATES['scheduler_off'][1])
         control_layout.addWidget(self.scheduler_btn)
         
         # 테스트 캡쳐 버튼
@@ -1325,7 +1989,8 @@ class ZoomAttendanceMainWindow(QMainWindow):
         indicator_layout = QHBoxLayout()
         
         self.face_indicator = QLabel("얼굴 감지 상태")
-        self.face_indicator.setStyleSheet("QLabel { background-color: #ff5555; color: white; padding: 10px; border-radius: 5px; }")
+        self.face_indicator.setStyleSheet(FACE_INDICATOR_STYLES['idle'])
+        self._face_state = 'idle'
         self.face_indicator.setAlignment(Qt.AlignCenter)
         indicator_layout.addWidget(self.face_indicator)
         
@@ -1373,47 +2038,42 @@ class ZoomAttendanceMainWindow(QMainWindow):
         로깅 시스템 설정 (파일 + GUI 로깅)
         """
         # 기본 파일 로깅 설정
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('zoom_attendance_gui.log', encoding='utf-8'),
-                logging.StreamHandler()  # 콘솔 출력
-            ]
-        )
+        _configure_file_logging()
         
         # GUI 로그 핸들러 추가 (log_text가 존재하는 경우에만)
         if hasattr(self, 'log_text') and self.log_text is not None:
-            class GuiLogHandler(logging.Handler):
-                def __init__(self, text_widget):
-                    super().__init__()
-                    self.text_widget = text_widget
-                
-                def emit(self, record):
-                    try:
-                        msg = self.format(record)
-                        timestamp = datetime.now().strftime('%H:%M:%S')
-                        self.text_widget.append(f"[{timestamp}] {msg}")
-                        # 스크롤을 맨 아래로
-                        cursor = self.text_widget.textCursor()
-                        cursor.movePosition(cursor.End)
-                        self.text_widget.setTextCursor(cursor)
-                    except Exception:
-                        pass  # GUI 오류 시 무시
-            
-            # GUI 핸들러 추가
-            gui_handler = GuiLogHandler(self.log_text)
-            gui_handler.setLevel(logging.INFO)
+            # 핸들러는 버퍼에만 쌓음 (다른 스레드에서 위젯을 직접 건드리지 않음)
+            self._gui_log_handler = _GuiLogHandler()
+            self._gui_log_handler.setLevel(logging.INFO)
             formatter = logging.Formatter('%(levelname)s - %(message)s')
-            gui_handler.setFormatter(formatter)
+            self._gui_log_handler.setFormatter(formatter)
             
             # 루트 로거에 추가
             root_logger = logging.getLogger()
-            root_logger.addHandler(gui_handler)
+            root_logger.addHandler(self._gui_log_handler)
+
+            # GUI 스레드에서 모아서 한 번에 추가 (로그가 몰려도 이벤트 루프 지연 방지)
+            self._log_flush_timer = QTimer(self)
+            self._log_flush_timer.timeout.connect(self._flush_gui_log)
+            self._log_flush_timer.start(GUI_LOG_FLUSH_MS)
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("Zoom 출석 자동화 프로그램 시작")
     
+    def _flush_gui_log(self):
+        """
+        버퍼에 쌓인 로그를 GUI 로그 창에 한 번에 추가
+        """
+        lines = self._gui_log_handler.drain()
+        if not lines:
+            return
+
+        self.log_text.append('\n'.join(lines))
+        # 스크롤을 맨 아래로
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(cursor.End)
+        self.log_text.setTextCursor(cursor)
+
     def update_monitor_list(self):
         """
         모니터 목록 업데이트
@@ -1429,7 +2089,9 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         Zoom 모니터 자동 감지
         """
-        zoom_monitor = self.monitor_manager.find_zoom_monitor()
+        # 지난번 Zoom 모니터를 먼저 확인하고, 아닐 때만 전체 모니터 탐색
+        zoom_monitor = self.monitor_manager.find_zoom_monitor(preferred=self.zoom_monitor)
+        self.zoom_monitor = zoom_monitor
         
         # 콤보박스에서 해당 모니터 선택
         for i in range(self.monitor_combo.count()):
@@ -1437,7 +2099,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.monitor_combo.setCurrentIndex(i)
                 break
         
-        if hasattr(self, 'status_labels') and self.status_labels:
+        if self.status_labels is not None:
             self.status_labels['monitor'].setText(f"모니터: {zoom_monitor}")
         self.logger.info(f"Zoom 모니터 자동 감지: 모니터 {zoom_monitor}")
     
@@ -1449,7 +2111,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         
         if selected_monitor and self.capture_thread:
             self.capture_thread.change_monitor(selected_monitor)
-            if hasattr(self, 'status_labels') and self.status_labels:
+            if self.status_labels is not None:
                 self.status_labels['monitor'].setText(f"모니터: {selected_monitor}")
             self.notification_system.notify_monitor_switched(selected_monitor)
             self.logger.info(f"모니터 변경: {selected_monitor}")
@@ -1466,30 +2128,27 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 selected_monitor = self.monitor_combo.currentData() or 2
                 self.logger.info(f"선택된 모니터: {selected_monitor}")
 
-                self.capture_thread = CaptureThread(selected_monitor)
-                self.logger.info("CaptureThread 생성 완료")
-
-                self.capture_thread.frame_ready.connect(self.update_screen)
-                self.capture_thread.original_frame_ready.connect(self.store_original_frame)
-                self.capture_thread.analysis_ready.connect(self.update_analysis)
-                self.capture_thread.error_occurred.connect(self.handle_error)
-                self.logger.info("시그널 연결 완료")
+                self._create_capture_thread(selected_monitor)
+                self.logger.info("CaptureThread 생성 및 시그널 연결 완료")
 
                 self.capture_thread.start()
                 self.logger.info("스레드 시작 완료")
 
                 self.is_monitoring = True
-                self.monitor_btn.setText("모니터링 중지")
-                self.monitor_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 14px; padding: 10px; font-weight: bold; }")
+                self._apply_btn(self.monitor_btn, 'monitor_on')
 
                 # 최상단 박스 형광초록색으로 강조
                 if hasattr(self, 'time_group'):
-                    self.time_group.setStyleSheet("QGroupBox { border: 3px solid #76FF03; font-weight: bold; }")
+                    self.time_group.setStyleSheet(TIME_GROUP_ACTIVE_STYLE)
 
-                # 상태 업데이트 타이머
-                self.status_timer = QTimer()
-                self.status_timer.timeout.connect(self.update_status)
-                self.status_timer.start(1000)  # 1초마다
+                # 상태 업데이트 타이머 (실시간 상태 타이머 status_timer와 별도)
+                self.monitor_status_timer = QTimer()
+                self.monitor_status_timer.setTimerType(Qt.PreciseTimer)
+                self.monitor_status_timer.timeout.connect(self.update_status)
+                self.monitor_status_timer.start(1000)  # 1초마다
+
+                # 현재 스케줄 상태를 즉시 반영
+                self._sync_capture_schedule()
 
                 self.logger.info("실시간 모니터링 시작 성공")
 
@@ -1504,27 +2163,29 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.capture_thread.stop()
                 self.capture_thread = None
             
-            if hasattr(self, 'status_timer'):
-                self.status_timer.stop()
+            if hasattr(self, 'monitor_status_timer'):
+                self.monitor_status_timer.stop()
             
             self.is_monitoring = False
-            self.monitor_btn.setText("모니터링 시작")
-            self.monitor_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 14px; padding: 10px; font-weight: bold; }")
+            self._apply_btn(self.monitor_btn, 'monitor_off')
 
             # 최상단 박스 스타일 원래대로
             if hasattr(self, 'time_group'):
                 self.time_group.setStyleSheet("")
 
             # 미리보기 초기화
-            if hasattr(self, 'preview_label') and self.preview_label:
+            if self.preview_label is not None:
                 self.preview_label.setText("모니터링을 시작하세요")
                 self.preview_label.setPixmap(QPixmap())
 
-            if hasattr(self, 'screen_label') and self.screen_label:
+            if self.screen_label is not None:
                 self.screen_label.setText("모니터링을 시작하세요")
-            if hasattr(self, 'face_indicator') and self.face_indicator:
+            if self.face_indicator is not None:
                 self.face_indicator.setText("얼굴 감지 상태")
-                self.face_indicator.setStyleSheet("QLabel { background-color: #ff5555; color: white; padding: 10px; border-radius: 5px; }")
+                self.face_indicator.setStyleSheet(FACE_INDICATOR_STYLES['idle'])
+                self._face_state = 'idle'
+            self._last_analysis = None
+            self._label_texts.clear()
             
             self.logger.info("실시간 모니터링 중지")
     
@@ -1535,6 +2196,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         if not self.scheduler:
             # 스케줄러 시작
             self.scheduler = ClassScheduler(capture_callback=self.scheduled_capture)
+            self._schedule_probe = None
             
             try:
                 # 별도 스레드에서 스케줄러 실행
@@ -1542,8 +2204,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.scheduler_thread = Thread(target=self.scheduler.start, daemon=True)
                 self.scheduler_thread.start()
                 
-                self.scheduler_btn.setText("자동 스케줄 중지")
-                self.scheduler_btn.setStyleSheet("QPushButton { background-color: #ff9800; color: white; font-size: 14px; padding: 10px; }")
+                self._apply_btn(self.scheduler_btn, 'scheduler_on')
                 
                 self.notification_system.notify_system_start()
                 self.logger.info("자동 스케줄러 시작")
@@ -1557,8 +2218,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.scheduler.stop()
                 self.scheduler = None
             
-            self.scheduler_btn.setText("자동 스케줄 시작")
-            self.scheduler_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-size: 14px; padding: 10px; }")
+            self._apply_btn(self.scheduler_btn, 'scheduler_off')
             
             self.notification_system.notify_system_stop()
             self.logger.info("자동 스케줄러 중지")
@@ -1577,13 +2237,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
         # 해당 교시의 캡처 제한 확인
         if period in self.period_capture_counts:
             if self.period_capture_counts[period] >= self.max_captures_per_period:
-                self.logger.info(f"{period}교시 캡처 완료 (5장 달성), 감지 중단")
+                self.logger.info("%d교시 캡처 완료 (5장 달성), 감지 중단", period)
                 return
         else:
             self.period_capture_counts[period] = 0
             
         self.current_period = period
-        self.logger.info(f"{period}교시 자동 캡쳐 시도 ({self.period_capture_counts[period] + 1}/5)")
+        self.logger.info("%d교시 자동 캡쳐 시도 (%d/5)", period, self.period_capture_counts[period] + 1)
         
         # 얼굴 감지 조건 확인 및 원본 프레임 저장 (모든 참가자가 감지된 경우만)
         if (self.current_original_frame is not None and 
@@ -1594,21 +2254,58 @@ class ZoomAttendanceMainWindow(QMainWindow):
             # 원본 화면을 폴더 구조에 맞게 저장
             capture_count = self.period_capture_counts[period] + 1
             capture_filename = self.get_capture_filepath(period, capture_count)
-            cv2.imwrite(capture_filename, self.current_original_frame)
 
-            # 캡처 카운트 증가
+            # 캡처 카운트 증가 (저장 완료 전에 증가시켜 파일명 중복 방지)
             self.period_capture_counts[period] += 1
 
-            self.logger.info(f"출석 조건 만족 - 원본 화면 저장: {capture_filename} ({self.period_capture_counts[period]}/5)")
-            self.attendance_logger.log_attendance(period, [capture_filename])
-            self.notification_system.notify_capture_success(period, capture_filename)
+            self.logger.info("출석 조건 만족 - 원본 화면 저장: %s (%d/5)",
+                             capture_filename, self.period_capture_counts[period])
+            self._submit_save(capture_filename, ('schedule', period))
         else:
-            self.logger.info(f"{period}교시 - 출석 조건 미달 (감지: {self.face_detected_count}/{self.total_participants})")
+            self.logger.info("%d교시 - 출석 조건 미달 (감지: %d/%d)",
+                             period, self.face_detected_count, self.total_participants)
         
         # GUI에서 교시 표시 업데이트
-        if hasattr(self, 'status_labels') and self.status_labels:
+        if self.status_labels is not None:
             self.status_labels['period'].setText(f"교시: {period}")
+            self._last_monitor_state = (True, period)
     
+    def on_capture_saved(self, path: str, success: bool, context):
+        """
+        캡쳐 저장 완료 처리 (GUI 스레드)
+
+        Args:
+            path (str): 저장된 파일 경로
+            success (bool): 저장 성공 여부
+            context: 저장 작업 정보 (종류, 교시/번호)
+        """
+        kind, number = context
+
+        # 저장에 사용한 프레임 버퍼 반환
+        with self._slab_lock:
+            slab = self._pending_saves.pop(path, None)
+            if slab is not None:
+                self._release_slab_locked(slab)
+
+        if not success:
+            self.logger.error(f"캡쳐 저장 실패: {path}")
+            if kind == 'schedule' and self.period_capture_counts.get(number, 0) > 0:
+                self.period_capture_counts[number] -= 1
+            return
+
+        if kind == 'schedule':
+            capture_count = self.period_capture_counts.get(number, 0)
+            # CSV 전체를 다시 쓰므로 GUI 스레드 대신 저장 풀에서 실행 (같은 파일은 잠금으로 순서 보장)
+            self.save_pool.start(_IoTask(
+                self.attendance_logger.log_attendance,
+                (datetime.now().strftime('%Y-%m-%d'), number, capture_count, [os.path.basename(path)]),
+                self._attendance_log_lock))
+            if capture_count >= self.max_captures_per_period:
+                self.notification_system.notify_capture_end(number, capture_count)
+
+                # 목표 달성 후 남은 시간대에는 캡쳐 스레드 분석 중단 (테스트 모드 중에는 유지)
+                self._sync_capture_schedule()
+
     def is_capture_time_for_period(self, period: int) -> bool:
         """
         해당 교시의 캡처 시간인지 확인 (35-40분)
@@ -1619,37 +2316,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
         Returns:
             bool: 캡처 시간 여부
         """
-        if hasattr(self, 'scheduler') and self.scheduler:
-            current_time = datetime.now().time()
-            
-            # 해당 교시의 시간표 가져오기
-            if period <= len(self.scheduler.class_schedule):
-                start_time, end_time = self.scheduler.class_schedule[period - 1]
-                
-                # 캡처 시작 시간 (교시 시작 + 35분)
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + 35
-                
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-                
-                # 캡처 종료 시간 (교시 시작 + 40분)
-                capture_end_hour = start_time.hour
-                capture_end_minute = start_time.minute + 40
-                
-                if capture_end_minute >= 60:
-                    capture_end_hour += 1
-                    capture_end_minute -= 60
-                
-                from datetime import time
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = time(capture_end_hour, capture_end_minute)
-                
-                return capture_start <= current_time <= capture_end
-        
-        return False
-    
+        window = self._capture_windows.get(period)
+        if window is None:
+            return False
+
+        now_sec = self._clock()
+        return window[0] <= now_sec <= window[1]
+
     def test_capture(self):
         """
         테스트 캡쳐 실행: 30초간 3장 촬영
@@ -1657,138 +2330,264 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         try:
             # 실시간 감지 시간 체크
-            from scheduler import ClassScheduler
-            from datetime import time
-
-            temp_scheduler = ClassScheduler(capture_callback=None)
-            now = datetime.now()
-            current_time = now.time()
-            class_schedule = temp_scheduler.class_schedule
-
-            # 현재 캡처 시간인지 확인
-            for period, (start_time, end_time) in enumerate(class_schedule, 1):
-                capture_start_hour = start_time.hour
-                capture_start_minute = start_time.minute + self.capture_start_minute
-                if capture_start_minute >= 60:
-                    capture_start_hour += 1
-                    capture_start_minute -= 60
-
-                capture_start = time(capture_start_hour, capture_start_minute)
-                capture_end = end_time
-
-                if capture_start <= current_time <= capture_end:
-                    QMessageBox.warning(
-                        self, "테스트 불가",
-                        f"실시간 감지 시간에는 테스트 캡쳐를 사용할 수 없습니다.\n현재: {period}교시 캡쳐 중"
-                    )
-                    return
+            period = self._current_live_period()
+            if period:
+                QMessageBox.warning(
+                    self, "테스트 불가",
+                    f"실시간 감지 시간에는 테스트 캡쳐를 사용할 수 없습니다.\n현재: {period}교시 캡쳐 중"
+                )
+                return
 
             # 테스트 캡쳐 시작
             self.logger.info("테스트 캡쳐 시작: 30초간 3장 촬영")
             self.test_btn.setEnabled(False)
             self.test_btn.setText("테스트 중...")
 
-            # 모니터링이 꺼져있었는지 기록
-            was_monitoring_off = not self.is_monitoring
+            # 모니터링이 꺼져있었는지 기록 (완료 후 캡쳐 스레드 종료 여부)
+            self._test_stop_thread = not self.is_monitoring
 
             # 캡쳐 스레드 시작 (없으면)
             if not self.is_monitoring:
                 selected_monitor = self.monitor_combo.currentData() or 2
-                self.capture_thread = CaptureThread(selected_monitor)
-                self.capture_thread.frame_ready.connect(self.update_screen)
-                self.capture_thread.original_frame_ready.connect(self.store_original_frame)
-                self.capture_thread.analysis_ready.connect(self.update_analysis)
+                self._create_capture_thread(selected_monitor)
                 self.capture_thread.start()
 
-            # 30초간 3장 촬영 (10초 간격)
-            import threading
+            # 테스트 중에는 수업 시간과 관계없이 짧은 간격으로 캡쳐
+            # (이미 켜둔 테스트 모드/수동 탐지가 있으면 완료 후 그대로 복원)
+            self._test_prev_mode = self.capture_thread.test_mode_active
+            self._set_capture_test_mode(True)
+            self.capture_thread.wake()
 
-            def test_capture_worker():
-                captured_files = []
-                for i in range(3):
-                    # 대기
-                    time.sleep(10 if i > 0 else 0)
+            # 30초간 3장 촬영 (10초 간격, GUI 스레드 타이머로 진행)
+            self._test_shot_idx = 0
+            self._test_files = []
+            self._test_timer.start()
+            self._test_capture_tick()
 
-                    # 캡쳐
-                    if self.current_original_frame is not None:
-                        test_file = self.get_test_filepath(i+1)
-                        cv2.imwrite(test_file, self.current_original_frame)
-                        captured_files.append(test_file)
+        except Exception as e:
+            self.logger.error(f"테스트 캡쳐 오류: {e}", exc_info=True)
+            self.test_btn.setEnabled(True)
+            self.test_btn.setText("테스트 캡쳐")
+            QMessageBox.critical(self, "오류", f"테스트 중 오류가 발생했습니다:\n{e}")
+    
+    def _test_capture_tick(self):
+        """
+        테스트 캡쳐 1회 촬영 (10초 간격 타이머), 3장 촬영 후 종료 처리
+        """
+        try:
+            self._test_shot_idx += 1
+            index = self._test_shot_idx
 
-                        self.logger.info(f"테스트 캡쳐 {i+1}/3: {test_file}")
+            if self.current_original_frame is not None:
+                test_file = self.get_test_filepath(index)
+                self._submit_save(test_file, ('test', index))
+                self._test_files.append(test_file)
 
-                        # UI 업데이트 (스레드 안전)
-                        self.capture_progress_label.setText(f"📸 테스트 캡쳐: {i+1}/3장")
+                self.logger.info(f"테스트 캡쳐 {index}/3: {test_file}")
+                self.capture_progress_label.setText(f"📸 테스트 캡쳐: {index}/3장")
 
-                # 완료 후 UI 복구
-                self.test_btn.setEnabled(True)
-                self.test_btn.setText("테스트 캡쳐")
-                self.capture_progress_label.setText("")
+            if index >= 3:
+                self._finish_test_capture()
 
-                # 모니터링이 원래 꺼져있었으면 종료
-                if was_monitoring_off and self.capture_thread:
-                    self.capture_thread.stop()
-                    self.capture_thread = None
+        except Exception as e:
+            self.logger.error(f"테스트 캡쳐 오류: {e}", exc_info=True)
+            self._finish_test_capture()
 
-                    # 미리보기 초기화
-                    if hasattr(self, 'preview_label'):
-                        self.preview_label.setText("모니터링을 시작하세요")
-                        self.preview_label.setPixmap(QPixmap())
+    def _finish_test_capture(self):
+        """
+        테스트 캡쳐 완료 후 UI 복구 및 결과 표시
+        """
+        self._test_timer.stop()
 
-                self.logger.info(f"테스트 캡쳐 완료: {len(captured_files)}장")
-                QMessageBox.information(
-                    self, "테스트 완료",
-                    f"테스트 캡쳐 완료\n{len(captured_files)}장 저장\n\n" + "\n".join(captured_files)
-                )
+        self.test_btn.setEnabled(True)
+        self.test_btn.setText("테스트 캡쳐")
+        self.capture_progress_label.setText("")
 
-            # 별도 스레드에서 실행
-            test_thread = threading.Thread(target=test_capture_worker, daemon=True)
-            test_thread.start()
+        # 모니터링이 원래 꺼져있었으면 종료, 아니면 테스트 전 모드로 복원
+        if self._test_stop_thread and self.capture_thread:
+            self.capture_thread.stop()
+            self.capture_thread = None
+
+            # 미리보기 초기화
+            if self.preview_label is not None:
+                self.preview_label.setText("모니터링을 시작하세요")
+                self.preview_label.setPixmap(QPixmap())
+        elif self.capture_thread:
+            self._set_capture_test_mode(self._test_prev_mode)
+
+        captured_files = self._test_files
+        self.logger.info(f"테스트 캡쳐 완료: {len(captured_files)}장")
+        QMessageBox.information(
+            self, "테스트 완료",
+            f"테스트 캡쳐 완료\n{len(captured_files)}장 저장\n\n" + "\n".join(captured_files)
+        )
+
+    def eventFilter(self, obj, event):
+        """
+        미리보기 라벨 크기 변경 감지
+        """
+        if obj is self.preview_label and event.type() == QEvent.Resize:
+            self._push_preview_size()
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        """
+        창 표시 이벤트 - 미리보기 표시 상태 갱신
+        """
+        super().showEvent(event)
+        self._update_preview_active()
+
+    def hideEvent(self, event):
+        """
+        창 숨김 이벤트 (트레이 최소화 등) - 미리보기 표시 상태 갱신
+        """
+        super().hideEvent(event)
+        self._update_preview_active()
+
+    def changeEvent(self, event):
+        """
+        창 상태 변경 이벤트 (최소화/복원) - 미리보기 표시 상태 갱신
+        """
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_preview_active()
+
+    def _update_preview_active(self):
+        """
+        미리보기가 실제로 보이는지 캡쳐 스레드에 전달 (메인 탭 + 창 표시/최소화 상태)
+        """
+        self._preview_visible = (self.isVisible() and not self.isMinimized() and
+                                 self.tab_widget.currentIndex() == 0)
+        if self.capture_thread is not None:
+            self.capture_thread.set_preview_active(self._preview_visible)
+
+    def _create_capture_thread(self, monitor_number: int):
+        """
+        캡쳐 스레드 생성 및 시그널 연결 (시작은 호출측에서)
+
+        프레임 시그널은 DirectConnection으로 캡쳐 스레드에서 바로 처리 (최신 프레임만 보관,
+        GUI 이벤트 큐를 거치지 않음). 큐를 거치는 것은 값이 바뀔 때만 오는 analysis_ready와
+        error_occurred뿐
+
+        Args:
+            monitor_number (int): 캡쳐할 모니터 번호
+        """
+        self.capture_thread = CaptureThread(monitor_number)
+        self._sync_preview_state()
+        self.capture_thread.frame_ready.connect(self.update_screen, Qt.DirectConnection)
+        self.capture_thread.original_frame_ready.connect(self.store_original_frame, Qt.DirectConnection)
+        self.capture_thread.analysis_ready.connect(self.update_analysis)
+        self.capture_thread.error_occurred.connect(self.handle_error)
+
+    def _sync_preview_state(self):
+        """
+        새 캡쳐 스레드에 미리보기 크기와 표시 상태 전달
+        """
+        self._push_preview_size()
+        self._update_preview_active()
+
+    def _push_preview_size(self):
+        """
+        캡쳐 스레드에 현재 미리보기 라벨 크기 전달
+        """
+        if self.capture_thread is not None and self.preview_label is not None:
+            size = self.preview_label.size()
+            self.capture_thread.set_preview_size(size.width(), size.height())
 
-        except Exception as e:
-            self.logger.error(f"테스트 캡쳐 오류: {e}", exc_info=True)
-            self.test_btn.setEnabled(True)
-            self.test_btn.setText("테스트 캡쳐")
-            QMessageBox.critical(self, "오류", f"테스트 중 오류가 발생했습니다:\n{e}")
-    
     def update_screen(self, frame: np.ndarray):
         """
-        화면 업데이트 - 메인 탭의 실시간 미리보기에 표시
-        스케줄 감지 시간에만 미리보기 표시
+        화면 업데이트 요청 - 캡쳐 스레드에서 직접 호출 (DirectConnection)
+
+        최신 프레임 1장만 보관하여 GUI가 느려도 프레임이 이벤트 큐에 쌓이지 않음
 
         Args:
             frame (np.ndarray): 캡쳐된 프레임
         """
+        # 미리보기가 보이지 않으면 보관하지 않음 (숨김/최소화/다른 탭)
+        if not self._preview_visible:
+            return
+
+        self._preview_mutex.lock()
+        try:
+            self._pending_preview = frame
+            request_flush = not self._preview_scheduled
+            self._preview_scheduled = True
+        finally:
+            self._preview_mutex.unlock()
+
+        if request_flush:
+            self.preview_requested.emit()
+
+    def _schedule_preview_flush(self):
+        """
+        미리보기 갱신 예약 (마지막 갱신 후 PREVIEW_INTERVAL_MS가 지나야 다시 그림)
+        """
+        if not self._preview_timer.isActive():
+            elapsed_ms = (time.monotonic() - self._last_paint) * 1000
+            self._preview_timer.start(max(0, int(PREVIEW_INTERVAL_MS - elapsed_ms)))
+
+    def _flush_preview(self):
+        """
+        대기 중인 최신 프레임으로 메인 탭의 실시간 미리보기 갱신
+        스케줄 감지 시간에만 미리보기 표시
+        """
+        self._preview_mutex.lock()
+        try:
+            frame = self._pending_preview
+            self._pending_preview = None
+            self._preview_scheduled = False
+        finally:
+            self._preview_mutex.unlock()
+
+        if frame is None or not self._preview_visible:
+            return
+
         try:
             # 스케줄 감지 시간인지 확인
             if not self._is_in_capture_window():
                 # 감지 시간이 아니면 미리보기 업데이트하지 않음 (카운트다운 유지)
                 return
 
-            # OpenCV BGR을 RGB로 변환
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if self.preview_label is None:
+                return
+
+            # 라벨 크기에 맞춰 비율 유지 (보통 캡쳐 스레드에서 이미 축소되어 옴)
+            label_size = self.preview_label.size()
+            h, w = frame.shape[:2]
+            fit_key = (w, h, label_size.width(), label_size.height())
+            if self._preview_fit[0] != fit_key:
+                self._preview_fit = (fit_key, _fit_size(*fit_key))
+            target_w, target_h = self._preview_fit[1]
+
+            # 프레임은 캡쳐 스레드에서 이미 PREVIEW_IMAGE_FORMAT 채널 순서로 옴 (색 변환 불필요)
+            if (target_w, target_h) != (w, h):
+                # 재사용 버퍼에 축소 결과 기록 (프레임마다 새 배열 할당 없음)
+                buf = self._preview_buf
+                if buf is None or buf.shape[:2] != (target_h, target_w):
+                    buf = self._preview_buf = np.empty((target_h, target_w, 3), np.uint8)
+                    # 버퍼를 감싸는 QImage도 버퍼와 함께 한 번만 생성 (메모리 공유)
+                    self._preview_qimage = QImage(buf.data, target_w, target_h, buf.strides[0],
+                                                  PREVIEW_IMAGE_FORMAT)
+                cv2.resize(frame, (target_w, target_h), dst=buf,
+                           interpolation=_resize_interpolation(w, target_w))
+                qt_image = self._preview_qimage
+            else:
+                # numpy 버퍼를 그대로 감싸는 QImage (복사 없음)
+                small = np.ascontiguousarray(frame)
+                qt_image = QImage(small.data, target_w, target_h, small.strides[0],
+                                  PREVIEW_IMAGE_FORMAT)
 
-            # QImage로 변환
-            h, w, ch = rgb_frame.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            # QPixmap 변환 시 한 번만 복사
+            pixmap = QPixmap.fromImage(qt_image)
 
-            # 메인 탭의 미리보기 라벨 크기에 맞게 조정
-            if hasattr(self, 'preview_label') and self.preview_label:
-                label_size = self.preview_label.size()
-                scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                    label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                self.preview_label.setPixmap(scaled_pixmap)
-                self._preview_default_set = False
-
-            # 기존 screen_label도 업데이트 (호환성)
-            if hasattr(self, 'screen_label') and self.screen_label:
-                label_size = self.screen_label.size()
-                scaled_pixmap = QPixmap.fromImage(qt_image).scaled(
-                    label_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                self.screen_label.setPixmap(scaled_pixmap)
+            # 메인 탭의 미리보기 라벨
+            self.preview_label.setPixmap(pixmap)
+            self._last_paint = time.monotonic()
+
+            # 기존 screen_label도 같은 pixmap으로 업데이트 (호환성, 다시 축소하지 않음)
+            # 모니터 패널이 화면에 없으면 건너뜀
+            if self.screen_label is not None and self.screen_label.isVisible():
+                self.screen_label.setPixmap(pixmap)
 
         except Exception as e:
             self.logger.error(f"화면 업데이트 오류: {e}")
@@ -1797,11 +2596,76 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         원본 프레임 저장 (시각화 없는 버전)
         
+        캡쳐 스레드에서 직접 호출됨 (DirectConnection) - 캡쳐 버퍼가 재사용되기 전에 복사
+        
         Args:
             frame (np.ndarray): 원본 캡쳐된 프레임
         """
-        self.current_original_frame = frame.copy()
-    
+        slab = self._acquire_slab(frame)
+        np.copyto(slab, frame)
+
+        with self._slab_lock:
+            previous = self._latest_slab
+            self._slab_refs[id(slab)] = 1
+            self._latest_slab = slab
+            if previous is not None:
+                self._release_slab_locked(previous)
+
+    @property
+    def current_original_frame(self):
+        """
+        가장 최근에 저장된 원본 프레임 (재사용 버퍼이므로 읽기 전용으로 사용)
+        """
+        return self._latest_slab
+
+    def _acquire_slab(self, frame: np.ndarray) -> np.ndarray:
+        """
+        풀에서 프레임과 같은 크기의 버퍼를 꺼냄 (없으면 새로 할당)
+
+        Args:
+            frame (np.ndarray): 저장할 프레임
+
+        Returns:
+            np.ndarray: 재사용 또는 새로 할당한 버퍼
+        """
+        while True:
+            try:
+                slab = self._slab_pool.get_nowait()
+            except queue.Empty:
+                return np.empty_like(frame)
+
+            # 해상도가 바뀐 이전 버퍼는 버림
+            if slab.shape == frame.shape:
+                return slab
+
+    def _release_slab_locked(self, slab: np.ndarray):
+        """
+        버퍼 참조 해제, 참조가 없으면 풀에 반환 (_slab_lock 보유 상태에서 호출)
+
+        Args:
+            slab (np.ndarray): 해제할 버퍼
+        """
+        key = id(slab)
+        self._slab_refs[key] -= 1
+        if self._slab_refs[key] == 0:
+            del self._slab_refs[key]
+            self._slab_pool.put(slab)
+
+    def _submit_save(self, path: str, context):
+        """
+        최신 원본 프레임을 복사 없이 저장 풀에 제출 (저장 완료 시 버퍼 반환)
+
+        Args:
+            path (str): 저장 경로
+            context: 완료 시 함께 전달할 작업 정보
+        """
+        with self._slab_lock:
+            slab = self._latest_slab
+            self._slab_refs[id(slab)] += 1
+            self._pending_saves[path] = slab
+
+        self.save_pool.start(_ImageSaveTask(path, slab, self.save_signals, context))
+
     def update_analysis(self, total_participants: int, face_detected: int, analysis_results: list):
         """
         분석 결과 업데이트 - 메인 탭 상태와 기존 상태 모두 업데이트
@@ -1813,57 +2677,118 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         self.total_participants = total_participants
         self.face_detected_count = face_detected
-        
-        # 메인 탭 상태 라벨 업데이트
-        if hasattr(self, 'participant_count_label'):
-            self.participant_count_label.setText(f"참여자: {total_participants}명")
-        if hasattr(self, 'face_count_label'):
-            self.face_count_label.setText(f"얼굴 감지: {face_detected}명")
+
+        # 표시 값이 이전과 같으면 라벨 갱신 생략 (불필요한 repaint 방지)
+        analysis_key = (total_participants, face_detected, self.required_face_count)
+        if analysis_key == self._last_analysis:
+            return
+        self._last_analysis = analysis_key
+
+        # 여러 라벨을 바꾸는 동안 그리기를 멈췄다가 감지 상태 박스를 한 번에 다시 그림
+        batch = self.detection_group
+        if batch is not None:
+            batch.setUpdatesEnabled(False)
+        try:
+            self._update_analysis_labels(total_participants, face_detected)
+        finally:
+            if batch is not None:
+                batch.setUpdatesEnabled(True)
+
+    def _update_analysis_labels(self, total_participants: int, face_detected: int):
+        """
+        분석 결과 라벨/인디케이터 갱신 (update_analysis에서 호출)
+
+        Args:
+            total_participants (int): 총 참가자 수
+            face_detected (int): 얼굴 감지된 수
+        """
+        # 메인 탭 상태 라벨 업데이트 (바뀐 라벨만)
+        if self.participant_count_label is not None:
+            self._set_label_text(self.participant_count_label, f"참여자: {total_participants}명")
+        if self.face_count_label is not None:
+            self._set_label_text(self.face_count_label, f"얼굴 감지: {face_detected}명")
         
         # 기존 상태 라벨 업데이트 (호환성)
-        if hasattr(self, 'status_labels') and self.status_labels:
-            self.status_labels['participants'].setText(f"참가자: {total_participants}명")
-            self.status_labels['detected'].setText(f"얼굴 감지: {face_detected}명")
+        if self.status_labels is not None:
+            self._set_label_text(self.status_labels['participants'], f"참가자: {total_participants}명")
+            self._set_label_text(self.status_labels['detected'], f"얼굴 감지: {face_detected}명")
             
             if total_participants > 0:
                 rate = (face_detected / total_participants) * 100
-                self.status_labels['rate'].setText(f"감지율: {rate:.1f}%")
+                self._set_label_text(self.status_labels['rate'], f"감지율: {rate:.1f}%")
             else:
-                self.status_labels['rate'].setText("감지율: 0%")
-        
-        # 인디케이터 업데이트
-        self.participant_indicator.setText(f"참가자: {total_participants}명")
+                self._set_label_text(self.status_labels['rate'], "감지율: 0%")
         
+        # 인디케이터 업데이트 (모니터 패널이 있는 경우)
+        if self.participant_indicator is not None:
+            self._set_label_text(self.participant_indicator, f"참가자: {total_participants}명")
+
+        if self.face_indicator is None:
+            return
+
         # 필요한 최소 얼굴 수와 비교하여 상태 결정
         meets_requirement = face_detected >= self.required_face_count
         
         if meets_requirement and face_detected > 0:
-            self.face_indicator.setText(f"✓ 출석 조건 만족 ({face_detected}/{self.required_face_count})")
-            self.face_indicator.setStyleSheet("QLabel { background-color: #4CAF50; color: white; padding: 10px; border-radius: 5px; }")
+            face_state = 'ok'
+            face_text = f"✓ 출석 조건 만족 ({face_detected}/{self.required_face_count})"
         elif face_detected > 0:
-            self.face_indicator.setText(f"⚠️ 부족 ({face_detected}/{self.required_face_count})")
-            self.face_indicator.setStyleSheet("QLabel { background-color: #FF9800; color: white; padding: 10px; border-radius: 5px; }")
+            face_state = 'warn'
+            face_text = f"⚠️ 부족 ({face_detected}/{self.required_face_count})"
         else:
-            self.face_indicator.setText("✗ 얼굴 없음")
-            self.face_indicator.setStyleSheet("QLabel { background-color: #f44336; color: white; padding: 10px; border-radius: 5px; }")
+            face_state = 'bad'
+            face_text = "✗ 얼굴 없음"
+        self._set_label_text(self.face_indicator, face_text)
+
+        # 상태가 바뀐 경우에만 스타일시트 적용 (매 프레임 CSS 재파싱 방지)
+        if face_state != self._face_state:
+            self.face_indicator.setStyleSheet(FACE_INDICATOR_STYLES[face_state])
+            self._face_state = face_state
     
+    def _set_label_text(self, label: QLabel, text: str):
+        """
+        라벨 텍스트가 마지막으로 설정한 값과 다를 때만 setText (불필요한 레이아웃/repaint 방지)
+
+        Args:
+            label (QLabel): 대상 라벨
+            text (str): 표시할 텍스트
+        """
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
+
+    def _set_label_style(self, label: QLabel, style: str):
+        """
+        라벨 스타일시트가 현재 값과 다를 때만 setStyleSheet (매초 CSS 재파싱 방지)
+
+        Args:
+            label (QLabel): 대상 라벨
+            style (str): 적용할 스타일시트 상수
+        """
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
     def update_status(self):
         """
         상태 정보 업데이트 (메인 탭과 컨트롤 탭 모두)
         """
-        current_time = datetime.now().strftime("%H:%M:%S")
+        self._clock()
+        current_time = self._clock_str
         
         # 컨트롤 탭의 status_labels 업데이트 (존재하는 경우)
-        if hasattr(self, 'status_labels') and self.status_labels:
+        if self.status_labels is not None:
             self.status_labels['time'].setText(f"시간: {current_time}")
             
-            # 현재 교시 확인
+            # 현재 교시 확인 (바뀔 때만 라벨 갱신)
             if self.scheduler:
-                is_class, period = self.scheduler.is_class_time()
-                if is_class:
-                    self.status_labels['period'].setText(f"교시: {period}")
-                else:
-                    self.status_labels['period'].setText("교시: 쉬는시간")
+                monitor_state = self.scheduler.is_class_time()
+                if monitor_state != self._last_monitor_state:
+                    self._last_monitor_state = monitor_state
+                    is_class, period = monitor_state
+                    if is_class:
+                        self.status_labels['period'].setText(f"교시: {period}")
+                    else:
+                        self.status_labels['period'].setText("교시: 쉬는시간")
     
     def on_main_face_threshold_changed(self, value: int):
         """
@@ -1881,8 +2806,8 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"학생 수 변경: {value}명")
 
             # 참여자 수 라벨 업데이트 (학생 + 교사 1명)
-            if hasattr(self, 'participant_count_label'):
-                self.participant_count_label.setText(f"예상 참여자: {value + 1}명 (교사포함)")
+            if self.participant_count_label is not None:
+                self._set_label_text(self.participant_count_label, f"예상 참여자: {value + 1}명 (교사포함)")
 
             # 오차범위 검증
             if self.absence_tolerance > value:
@@ -1896,7 +2821,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                     self.tolerance_value_label.setText(str(self.absence_tolerance))
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
             # 설정 탭의 SpinBox도 동기화
             if hasattr(self, 'face_threshold_spin'):
@@ -1921,8 +2846,8 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"학생 수 변경: {new_value}명")
 
             # 참여자 수 라벨 업데이트
-            if hasattr(self, 'participant_count_label'):
-                self.participant_count_label.setText(f"예상 참여자: {new_value + 1}명 (교사포함)")
+            if self.participant_count_label is not None:
+                self._set_label_text(self.participant_count_label, f"예상 참여자: {new_value + 1}명 (교사포함)")
 
             # 오차범위 검증
             if self.absence_tolerance > new_value:
@@ -1931,7 +2856,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                     self.tolerance_value_label.setText(str(self.absence_tolerance))
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"학생 수 증가 오류: {e}", exc_info=True)
@@ -1951,8 +2876,8 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"학생 수 변경: {new_value}명")
 
             # 참여자 수 라벨 업데이트
-            if hasattr(self, 'participant_count_label'):
-                self.participant_count_label.setText(f"예상 참여자: {new_value + 1}명 (교사포함)")
+            if self.participant_count_label is not None:
+                self._set_label_text(self.participant_count_label, f"예상 참여자: {new_value + 1}명 (교사포함)")
 
             # 오차범위 검증
             if self.absence_tolerance > new_value:
@@ -1961,7 +2886,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                     self.tolerance_value_label.setText(str(self.absence_tolerance))
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"학생 수 감소 오류: {e}", exc_info=True)
@@ -1986,7 +2911,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"오차범위 변경: {new_value}명")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"오차범위 증가 오류: {e}", exc_info=True)
@@ -2006,7 +2931,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"오차범위 변경: {new_value}명")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"오차범위 감소 오류: {e}", exc_info=True)
@@ -2036,6 +2961,19 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.error(f"폴더 열기 오류: {e}", exc_info=True)
             QMessageBox.warning(self, "오류", f"폴더를 열 수 없습니다:\n{e}")
 
+    def _ensure_dir(self, folder: str):
+        """
+        저장 폴더 생성 (확인된 폴더는 stat 한 번으로 존재만 확인)
+        실행 중에 폴더가 삭제되었으면 다시 생성
+
+        Args:
+            folder (str): 생성할 폴더 경로
+        """
+        if folder in self._ready_dirs and os.path.isdir(folder):
+            return
+        os.makedirs(folder, exist_ok=True)
+        self._ready_dirs.add(folder)
+
     def get_capture_filepath(self, period: int, index: int) -> str:
         """
         캡쳐 파일 경로 생성
@@ -2052,15 +2990,15 @@ class ZoomAttendanceMainWindow(QMainWindow):
         date_folder = os.path.join(self.base_folder, date_str)
         period_folder = os.path.join(date_folder, f"{period}교시")
 
-        os.makedirs(period_folder, exist_ok=True)
+        self._ensure_dir(period_folder)
 
-        filename = f"{date_str}_{period}교시({index}).png"
+        filename = f"{date_str}_{period}교시({index}).{self.capture_format}"
         return os.path.join(period_folder, filename)
 
     def get_test_filepath(self, index: int) -> str:
         """
         테스트 캡쳐 파일 경로 생성
-        바탕화면/강의출석자동화/테스트캡쳐/날짜_testN.png
+        바탕화면/강의출석자동화/테스트캡쳐/날짜_testN.jpg (capture_format 확장자)
 
         Args:
             index (int): 파일 인덱스
@@ -2069,10 +3007,10 @@ class ZoomAttendanceMainWindow(QMainWindow):
             str: 파일 전체 경로
         """
         test_folder = os.path.join(self.base_folder, "테스트캡쳐")
-        os.makedirs(test_folder, exist_ok=True)
+        self._ensure_dir(test_folder)
 
         date_str = datetime.now().strftime("%y%m%d")
-        filename = f"{date_str}_test{index}.png"
+        filename = f"{date_str}_test{index}.{self.capture_format}"
         return os.path.join(test_folder, filename)
 
     def on_start_minute_changed(self, value: int):
@@ -2087,10 +3025,11 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 return
 
             self.capture_start_minute = value
+            self._rebuild_capture_windows()
             self.logger.info(f"촬영 시작 시간 변경: {value}분")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"시작 시간 변경 처리 오류: {e}", exc_info=True)
@@ -2113,7 +3052,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"재시도 간격 변경: {value}분")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"재시도 간격 변경 처리 오류: {e}", exc_info=True)
@@ -2139,7 +3078,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"재시도 횟수 변경: {value}번")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"재시도 횟수 변경 처리 오류: {e}", exc_info=True)
@@ -2170,7 +3109,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.logger.info("⚠️ 실시간 감지 모드: 재시도 로직이 비활성화되고 목표 달성 또는 교시 종료까지 계속됩니다")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"감지 모드 변경 처리 오류: {e}", exc_info=True)
@@ -2193,7 +3132,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.logger.info(f"목표 사진 수 변경: {value}장")
 
             # 설정 저장 (비동기)
-            QTimer.singleShot(100, self.save_settings)
+            self._schedule_save()
 
         except Exception as e:
             self.logger.error(f"목표 사진 수 변경 처리 오류: {e}", exc_info=True)
@@ -2237,6 +3176,15 @@ class ZoomAttendanceMainWindow(QMainWindow):
         if self.scheduler:
             self.toggle_scheduler()
         
+        # 예약된 설정 저장 즉시 반영
+        if self._save_debounce.isActive():
+            self._save_debounce.stop()
+            self.save_settings()
+
+        # 백그라운드에서 인코딩 중인 캡쳐가 파일로 기록될 때까지 대기
+        if not self.save_pool.waitForDone(SAVE_SHUTDOWN_TIMEOUT_MS):
+            self.logger.warning("일부 캡쳐 저장이 완료되지 않은 채 종료합니다")
+
         # 시스템 트레이 제거
         if hasattr(self, 'tray_icon'):
             self.tray_icon.hide()
@@ -2246,6 +3194,33 @@ class ZoomAttendanceMainWindow(QMainWindow):
     
     # === 새로운 기능들 ===
     
+    def _apply_btn(self, button: QPushButton, state: str, text: str = None):
+        """
+        버튼에 상태별 텍스트/스타일 적용 (변경된 경우에만 Qt에 반영)
+
+        Args:
+            button (QPushButton): 대상 버튼
+            state (str): BUTTON_STATES 키
+            text (str): 기본 텍스트 대신 표시할 텍스트 (선택)
+        """
+        default_text, style = BUTTON_STATES[state]
+        text = text or default_text
+
+        text_changed = button.text() != text
+        style_changed = button.styleSheet() != style
+        if not (text_changed or style_changed):
+            return
+
+        # 텍스트와 스타일을 함께 바꿀 때 중간 상태를 그리지 않도록 한 번에 반영
+        button.setUpdatesEnabled(False)
+        try:
+            if text_changed:
+                button.setText(text)
+            if style_changed:
+                button.setStyleSheet(style)
+        finally:
+            button.setUpdatesEnabled(True)
+
     def toggle_test_mode(self):
         """
         테스트 모드 온/오프 - 실시간 얼굴 탐지 시각화
@@ -2254,8 +3229,7 @@ class ZoomAttendanceMainWindow(QMainWindow):
         
         if self.test_detection_active:
             # 테스트 모드 시작
-            self.test_mode_btn.setText("🟢 테스트 모드 중지")
-            self.test_mode_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 14px; padding: 10px; }")
+            self._apply_btn(self.test_mode_btn, 'test_on')
             self.logger.info("실시간 테스트 모드 시작 - 강제 얼굴 탐지 활성화")
             
             # 캡쳐 스레드가 실행 중이 아니면 시작
@@ -2263,18 +3237,15 @@ class ZoomAttendanceMainWindow(QMainWindow):
                 self.toggle_monitoring()
             
             # 캡쳐 스레드에 테스트 모드 설정
-            if self.capture_thread:
-                self.capture_thread.test_mode_active = True
+            self._set_capture_test_mode(True)
                 
         else:
             # 테스트 모드 중지
-            self.test_mode_btn.setText("🔴 테스트 모드 시작")
-            self.test_mode_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-size: 14px; padding: 10px; }")
+            self._apply_btn(self.test_mode_btn, 'test_off')
             self.logger.info("실시간 테스트 모드 중지")
             
             # 캡쳐 스레드의 테스트 모드 해제
-            if self.capture_thread:
-                self.capture_thread.test_mode_active = False
+            self._set_capture_test_mode(False)
     
     def start_manual_detection(self):
         """
@@ -2282,15 +3253,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         duration = self.duration_spinbox.value()
         
-        if self.manual_detection_timer and self.manual_detection_timer.isActive():
+        if self.manual_detection_timer.isActive():
             # 이미 실행 중이면 중지
             self.manual_detection_timer.stop()
-            self.manual_detect_btn.setText("⏰ 지정 시간 탐지 시작")
-            self.manual_detect_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; font-size: 12px; padding: 8px; }")
+            self._apply_btn(self.manual_detect_btn, 'manual_off')
             
             # 캡쳐 스레드의 테스트 모드 해제
-            if self.capture_thread:
-                self.capture_thread.test_mode_active = False
+            self._set_capture_test_mode(False)
             
             self.logger.info("수동 탐지 중지")
             return
@@ -2300,18 +3269,13 @@ class ZoomAttendanceMainWindow(QMainWindow):
             self.toggle_monitoring()
         
         # 수동 탐지 시작
-        self.manual_detect_btn.setText(f"⏹️ 탐지 중지 ({duration}초)")
-        self.manual_detect_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; font-size: 12px; padding: 8px; }")
+        self._apply_btn(self.manual_detect_btn, 'manual_on', f"⏹️ 탐지 중지 ({duration}초)")
         
         # 캡쳐 스레드에 테스트 모드 설정
-        if self.capture_thread:
-            self.capture_thread.test_mode_active = True
+        self._set_capture_test_mode(True)
         
-        # 타이머 설정
-        self.manual_detection_timer = QTimer()
-        self.manual_detection_timer.setSingleShot(True)
-        self.manual_detection_timer.timeout.connect(self.stop_manual_detection)
-        self.manual_detection_timer.start(duration * 1000)  # 초를 밀리초로 변환
+        # 타이머 시작 (초를 밀리초로 변환)
+        self.manual_detection_timer.start(duration * 1000)
         
         self.logger.info(f"수동 탐지 시작: {duration}초간")
     
@@ -2319,12 +3283,10 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         수동 탐지 중지
         """
-        self.manual_detect_btn.setText("⏰ 지정 시간 탐지 시작")
-        self.manual_detect_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; font-size: 12px; padding: 8px; }")
+        self._apply_btn(self.manual_detect_btn, 'manual_off')
         
         # 캡쳐 스레드의 테스트 모드 해제
-        if self.capture_thread:
-            self.capture_thread.test_mode_active = False
+        self._set_capture_test_mode(False)
         
         self.logger.info("수동 탐지 완료")
     
@@ -2337,26 +3299,21 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         try:
             # 현재 UI 값들을 변수에 저장 (안전하게)
-            if hasattr(self, 'face_count_spinbox') and self.face_count_spinbox:
+            if self.face_count_spinbox is not None:
                 self.required_face_count = self.face_count_spinbox.value()
-            if hasattr(self, 'duration_spinbox') and self.duration_spinbox:
+            if self.duration_spinbox is not None:
                 self.manual_duration = self.duration_spinbox.value()
 
-            # QSettings에 저장
-            self.settings.setValue('required_face_count', self.required_face_count)
-            self.settings.setValue('absence_tolerance', self.absence_tolerance)
-            self.settings.setValue('manual_duration', self.manual_duration)
+            # QSettings에 저장 (모든 값 기록 후 한 번만 sync)
+            settings = self.settings
+            for key in SAVED_SETTING_KEYS:
+                settings.setValue(key, getattr(self, key))
+            settings.sync()
 
-            # 스케줄 설정 저장
-            self.settings.setValue('capture_start_minute', self.capture_start_minute)
-            self.settings.setValue('retry_interval', self.retry_interval)
-            self.settings.setValue('retry_count', self.retry_count)
-            self.settings.setValue('detection_duration_mode', self.detection_duration_mode)
-            self.settings.setValue('target_photo_count', self.target_photo_count)
-
-            self.logger.debug(f"설정 저장: 학생={self.required_face_count}, 오차범위={self.absence_tolerance}, 시간={self.manual_duration}초, "
-                            f"시작분={self.capture_start_minute}, 재시도={self.retry_count}회/{self.retry_interval}분, "
-                            f"감지시간={self.detection_duration_mode}초, 목표사진={self.target_photo_count}장")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"설정 저장: 학생={self.required_face_count}, 오차범위={self.absence_tolerance}, 시간={self.manual_duration}초, "
+                                f"시작분={self.capture_start_minute}, 재시도={self.retry_count}회/{self.retry_interval}분, "
+                                f"감지시간={self.detection_duration_mode}초, 목표사진={self.target_photo_count}장")
 
             # 사용자에게 알림 (명시적으로 요청한 경우만)
             if show_message:
@@ -2368,6 +3325,12 @@ class ZoomAttendanceMainWindow(QMainWindow):
         except Exception as e:
             self.logger.error(f"설정 저장 오류: {e}", exc_info=True)
     
+    def _schedule_save(self):
+        """
+        설정 저장 예약 (디바운스 타이머 재시작)
+        """
+        self._save_debounce.start()
+
     def save_schedule_settings(self):
         """
         교시별 스케줄 설정 저장
@@ -2376,8 +3339,9 @@ class ZoomAttendanceMainWindow(QMainWindow):
         for period, checkbox in self.class_checkboxes.items():
             self.class_schedules[period] = checkbox.isChecked()
         
-        # QSettings에 저장
-        self.settings.setValue('class_schedules', json.dumps(self.class_schedules))
+        # QSettings에 저장 (교시당 1비트 정수 - 이전 JSON 형식 키는 제거)
+        self.settings.setValue('class_schedules_mask', _schedules_to_mask(self.class_schedules))
+        self.settings.remove('class_schedules')
         
         # 활성화된 교시 목록
         active_classes = [str(p) for p, active in self.class_schedules.items() if active]
@@ -2409,26 +3373,38 @@ class ZoomAttendanceMainWindow(QMainWindow):
         """
         try:
             # 기본값 또는 저장된 값 로드
-            self.required_face_count = int(self.settings.value('required_face_count', 1))
-            self.absence_tolerance = int(self.settings.value('absence_tolerance', 0))
-            self.manual_duration = int(self.settings.value('manual_duration', 30))
+            self.required_face_count = self.settings.value('required_face_count', 1, type=int)
+            self.absence_tolerance = self.settings.value('absence_tolerance', 0, type=int)
+            self.manual_duration = self.settings.value('manual_duration', 30, type=int)
 
             # 스케줄 설정 로드
-            self.capture_start_minute = int(self.settings.value('capture_start_minute', 40))
-            self.retry_interval = int(self.settings.value('retry_interval', 5))
-            self.retry_count = int(self.settings.value('retry_count', 3))
-            self.detection_duration_mode = int(self.settings.value('detection_duration_mode', 60))
-            self.target_photo_count = int(self.settings.value('target_photo_count', 5))
+            self.capture_start_minute = self.settings.value('capture_start_minute', 40, type=int)
+            self.retry_interval = self.settings.value('retry_interval', 5, type=int)
+            self.retry_count = self.settings.value('retry_count', 3, type=int)
+            self.detection_duration_mode = self.settings.value('detection_duration_mode', 60, type=int)
+            self.target_photo_count = self.settings.value('target_photo_count', 5, type=int)
+
+            # 캡쳐 저장 포맷 (무손실이 필요하면 'png')
+            self.capture_format = self.settings.value('capture_format', DEFAULT_CAPTURE_FORMAT, type=str).lower()
+            if self.capture_format not in CAPTURE_ENCODE_PARAMS:
+                self.capture_format = DEFAULT_CAPTURE_FORMAT
+
+            # 마지막으로 사용한 Zoom 모니터 (0이면 없음)
+            self.zoom_monitor = self.settings.value('zoom_monitor', 0, type=int)
 
             # 검증: 오차범위가 학생 수보다 많으면 안됨
             if self.absence_tolerance > self.required_face_count:
                 self.logger.warning(f"오차범위({self.absence_tolerance})가 학생 수({self.required_face_count})보다 많음. {self.required_face_count}로 재설정.")
                 self.absence_tolerance = self.required_face_count
 
-            # 교시 설정 로드
-            saved_schedules = self.settings.value('class_schedules', None)
-            if saved_schedules:
-                self.class_schedules = json.loads(saved_schedules)
+            # 교시 설정 로드 (비트마스크, 없으면 이전 버전의 JSON 형식에서 변환)
+            if self.settings.contains('class_schedules_mask'):
+                self.class_schedules = _mask_to_schedules(
+                    self.settings.value('class_schedules_mask', ALL_CLASSES_MASK, type=int))
+            else:
+                saved_schedules = self.settings.value('class_schedules', None)
+                if saved_schedules:
+                    self.class_schedules = _mask_to_schedules(_schedules_to_mask(json.loads(saved_schedules)))
 
             self.logger.info(f"설정 로드 완료: 학생={self.required_face_count}, 오차범위={self.absence_tolerance}, "
                            f"시작분={self.capture_start_minute}, 재시도={self.retry_count}회/{self.retry_interval}분")
@@ -2438,18 +3414,43 @@ class ZoomAttendanceMainWindow(QMainWindow):
             # 기본값 사용
             self.required_face_count = 1
             self.manual_duration = 30
-            self.class_schedules = {i: True for i in range(1, 9)}
-    
+            self.zoom_monitor = 0
+            self.capture_format = DEFAULT_CAPTURE_FORMAT
+            self.class_schedules = _mask_to_schedules(ALL_CLASSES_MASK)
+
+        self._rebuild_capture_windows()
+
+    def _rebuild_capture_windows(self):
+        """
+        교시별 캡처 시간대를 미리 계산 (시간표 또는 시작 분 변경 시 호출)
+        """
+        class_schedule = self._class_schedule
+
+        # 하루 중 초(second-of-day) 정수로 저장하여 비교 시 객체 생성 없이 정수 비교
+        capture_windows = {}
+        live_starts = []
+        live_ends = []
+        for period, (start_time, end_time) in enumerate(class_schedule, 1):
+            start = start_time.hour * 3600 + start_time.minute * 60
+            capture_windows[period] = (start + 35 * 60, start + 40 * 60)
+            live_starts.append(start + self.capture_start_minute * 60)
+            live_ends.append(end_time.hour * 3600 + end_time.minute * 60)
+
+        self._capture_windows = capture_windows
+
+        # 실시간 감지 시간대는 이진 검색용 정렬 배열로 보관 (교시 순서 = 시간 순서)
+        self._live_bounds = (np.array(live_starts, np.int32), np.array(live_ends, np.int32))
+
     def update_ui_from_settings(self):
         """
         설정값으로 UI 컨트롤 업데이트
         """
         try:
             # 스핀박스 값 설정
-            if hasattr(self, 'face_count_spinbox'):
+            if self.face_count_spinbox is not None:
                 self.face_count_spinbox.setValue(self.required_face_count)
 
-            if hasattr(self, 'duration_spinbox'):
+            if self.duration_spinbox is not None:
                 self.duration_spinbox.setValue(self.manual_duration)
 
             # 스케줄 설정 UI 반영
@@ -2494,14 +3495,7 @@ def main():
     app.setQuitOnLastWindowClosed(False)  # 트레이 모드 지원
     
     # 로깅 설정
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('zoom_attendance_gui.log', encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    _configure_file_logging()
     
     # 메인 윈도우 생성
     window = ZoomAttendanceMainWindow()
@@ -41,7 +41,7 @@ class ZoomAttendanceSystem:
         os.makedirs(output_dir, exist_ok=True)
         
         # 각 모듈 초기화
-        self.face_detector = FaceDetector(min_face_size=30)
+        self.face_detector = FaceDetector()
         self.screen_capturer = ScreenCapture(monitor_number=1)
         self.attendance_logger = AttendanceLogger(log_file)
         
@@ -112,7 +112,7 @@ class ZoomAttendanceSystem:
                 return
             
             # 얼굴 감지
-            has_faces = self.face_detector.has_faces(screenshot, confidence_threshold=0.8)
+            has_faces = self.face_detector.has_faces(screenshot, confidence_threshold=0.8, track=True)
             
             if has_faces:
                 # 얼굴이 감지되면 후보에 추가
@@ -237,7 +237,9 @@ class ZoomAttendanceSystem:
                 # 얼굴이 있는 경우 시각화 이미지 저장
                 face_image = self.face_detector.draw_faces(
                     screenshot, 
-                    os.path.join(self.output_dir, "test_face_detection.png")
+                    os.path.join(self.output_dir, "test_face_detection.png"),
+                    faces=faces,
+                    in_place=True
                 )
                 self.logger.info("- 얼굴 감지 결과 이미지 저장 완료")
             
@@ -98,75 +98,97 @@ class MonitorManager:
             monitor = self.monitors[monitor_number]
             screenshot = self.sct.grab(monitor)
             
-            # PIL Image로 변환 후 numpy 배열로
-            from PIL import Image
-            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-            img_array = np.array(img)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+            # mss 원본 BGRA 버퍼를 복사 없이 numpy로 보기 (PIL/RGB 왕복 변환 없음)
+            bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                screenshot.height, screenshot.width, 4
+            )
             
-            # 크기 조절
-            height, width = img_bgr.shape[:2]
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
+            # 먼저 축소한 뒤 작은 이미지만 BGR로 변환
+            new_width = max(1, int(screenshot.width * scale_factor))
+            new_height = max(1, int(screenshot.height * scale_factor))
             
-            resized = cv2.resize(img_bgr, (new_width, new_height))
-            return resized
+            resized = cv2.resize(bgra, (new_width, new_height), interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(resized, cv2.COLOR_BGRA2BGR)
             
         except Exception as e:
             self.logger.error(f"모니터 {monitor_number} 미리보기 캡쳐 실패: {e}")
             return np.array([])
     
-    def find_zoom_monitor(self) -> int:
+    def is_zoom_monitor(self, monitor_num: int) -> bool:
+        """
+        해당 모니터에 Zoom 화면이 떠 있는지 확인 (휴리스틱 방법)
+        
+        Args:
+            monitor_num (int): 확인할 모니터 번호
+            
+        Returns:
+            bool: Zoom 특징이 감지되면 True
+        """
+        if not 1 <= monitor_num < len(self.monitors):
+            return False
+        
+        try:
+            preview = self.capture_monitor_preview(monitor_num, 0.2)
+            if preview.size == 0:
+                return False
+            
+            # Zoom 특징 감지 (간단한 휴리스틱)
+            # 1. 어두운 배경 (Zoom의 기본 배경)
+            # 2. 네모난 영역들 (참가자 박스들)
+            
+            gray = cv2.cvtColor(preview, cv2.COLOR_BGR2GRAY)
+            
+            # 어두운 픽셀 비율 계산
+            dark_pixels = np.sum(gray < 50)
+            total_pixels = gray.size
+            dark_ratio = dark_pixels / total_pixels
+            
+            # 사각형 영역 감지
+            edges = cv2.Canny(gray, 50, 150)
+            contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            
+            # 적당한 크기의 사각형 개수
+            rect_count = 0
+            for contour in contours:
+                area = cv2.contourArea(contour)
+                if 500 < area < 50000:  # 적당한 크기
+                    # 사각형인지 확인
+                    approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+                    if len(approx) >= 4:
+                        rect_count += 1
+            
+            self.logger.debug(f"모니터 {monitor_num}: 어두운 비율={dark_ratio:.2f}, 사각형 수={rect_count}")
+            
+            # Zoom 가능성 점수 계산
+            zoom_score = dark_ratio * 0.7 + (rect_count / 10) * 0.3
+            
+            if zoom_score > 0.3 and rect_count >= 2:
+                self.logger.info(f"모니터 {monitor_num}에서 Zoom 감지됨 (점수: {zoom_score:.2f})")
+                return True
+                
+        except Exception as e:
+            self.logger.error(f"모니터 {monitor_num} Zoom 감지 실패: {e}")
+        
+        return False
+    
+    def find_zoom_monitor(self, preferred: int = None) -> int:
         """
         Zoom이 실행 중인 모니터를 찾기 (휴리스틱 방법)
         
+        Args:
+            preferred (int): 먼저 확인할 모니터 번호 (이전에 감지된 모니터)
+        
         Returns:
             int: Zoom이 있을 가능성이 높은 모니터 번호
         """
+        # 이전 감지 결과가 여전히 유효하면 전체 모니터 탐색 생략
+        if preferred and self.is_zoom_monitor(preferred):
+            return preferred
+        
         # 각 모니터를 캡쳐해서 Zoom 특징을 찾기
         for monitor_num in range(1, len(self.monitors)):
-            try:
-                preview = self.capture_monitor_preview(monitor_num, 0.2)
-                if preview.size == 0:
-                    continue
-                
-                # Zoom 특징 감지 (간단한 휴리스틱)
-                # 1. 어두운 배경 (Zoom의 기본 배경)
-                # 2. 네모난 영역들 (참가자 박스들)
-                
-                gray = cv2.cvtColor(preview, cv2.COLOR_BGR2GRAY)
-                
-                # 어두운 픽셀 비율 계산
-                dark_pixels = np.sum(gray < 50)
-                total_pixels = gray.size
-                dark_ratio = dark_pixels / total_pixels
-                
-                # 사각형 영역 감지
-                edges = cv2.Canny(gray, 50, 150)
-                contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                
-                # 적당한 크기의 사각형 개수
-                rect_count = 0
-                for contour in contours:
-                    area = cv2.contourArea(contour)
-                    if 500 < area < 50000:  # 적당한 크기
-                        # 사각형인지 확인
-                        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
-                        if len(approx) >= 4:
-                            rect_count += 1
-                
-                self.logger.debug(f"모니터 {monitor_num}: 어두운 비율={dark_ratio:.2f}, 사각형 수={rect_count}")
-                
-                # Zoom 가능성 점수 계산
-                zoom_score = dark_ratio * 0.7 + (rect_count / 10) * 0.3
-                
-                if zoom_score > 0.3 and rect_count >= 2:
-                    self.logger.info(f"모니터 {monitor_num}에서 Zoom 감지됨 (점수: {zoom_score:.2f})")
-                    return monitor_num
-                    
-            except Exception as e:
-                self.logger.error(f"모니터 {monitor_num} Zoom 감지 실패: {e}")
-                continue
+            if monitor_num != preferred and self.is_zoom_monitor(monitor_num):
+                return monitor_num
         
         # 감지 실패 시 서브 모니터(2번) 기본 반환
         if len(self.monitors) > 2:
@@ -39,56 +39,61 @@ class ClassScheduler:
             (time(17, 30), time(18, 30)),  # 8교시
         ]
         
+        # 교시별 캡쳐 시간 (35~40분) - 매번 시/분 올림 계산하지 않도록 미리 계산
+        self._capture_windows = [
+            (self._offset_time(start_time, 35), self._offset_time(start_time, 40))
+            for start_time, _ in self.class_schedule
+        ]
+        
         self.logger.info(f"총 {len(self.class_schedule)}교시 스케줄 설정 완료")
     
+    @staticmethod
+    def _offset_time(base: time, minutes: int) -> time:
+        """
+        기준 시각에 분을 더한 시각 계산 (자정 넘어가면 0시부터)
+        
+        Args:
+            base (time): 기준 시각
+            minutes (int): 더할 분
+            
+        Returns:
+            time: 계산된 시각
+        """
+        total = base.hour * 60 + base.minute + minutes
+        return time((total // 60) % 24, total % 60)
+    
     def setup_capture_jobs(self):
         """
         각 교시별 캡쳐 작업을 스케줄러에 등록
         각 교시의 35분~40분 사이에 캡쳐 수행 (5분간)
+        분마다 작업을 따로 만들지 않고 교시당 분 범위 cron 작업 하나로 등록
+        (캡쳐 구간이 정시를 넘어가면 시간대별로 나눠 두 개)
         """
-        for period, (start_time, end_time) in enumerate(self.class_schedule, 1):
-            # 캡쳐 시작 시간 (교시 시작 + 35분)
-            capture_start_hour = start_time.hour
-            capture_start_minute = start_time.minute + 35
-            
-            # 60분 넘어가면 시간 조정
-            if capture_start_minute >= 60:
-                capture_start_hour += 1
-                capture_start_minute -= 60
-            
-            # 캡쳐 종료 시간 (교시 시작 + 40분) - 5분간만
-            capture_end_hour = start_time.hour
-            capture_end_minute = start_time.minute + 40
-            
-            if capture_end_minute >= 60:
-                capture_end_hour += 1
-                capture_end_minute -= 60
+        for period, (capture_start, capture_end) in enumerate(self._capture_windows, 1):
+            if capture_start.hour == capture_end.hour:
+                minute_ranges = [(capture_start.hour, capture_start.minute, capture_end.minute)]
+            else:
+                minute_ranges = [(capture_start.hour, capture_start.minute, 59),
+                                 (capture_end.hour, 0, capture_end.minute)]
             
-            # 캡쳐 작업 스케줄 등록 (매분마다 실행)
-            for minute in range(capture_start_minute, capture_end_minute + 1):
-                hour = capture_start_hour
-                if minute >= 60:
-                    hour += 1
-                    minute -= 60
-                
-                job_id = f"capture_period_{period}_time_{hour:02d}{minute:02d}"
-                
+            # 캡쳐 작업 스케줄 등록 (구간 안에서 매분 0초마다 실행)
+            for hour, first_minute, last_minute in minute_ranges:
                 self.scheduler.add_job(
                     func=self._execute_capture,
                     trigger=CronTrigger(
                         hour=hour,
-                        minute=minute,
+                        minute=f"{first_minute}-{last_minute}",
                         second=0
                     ),
                     args=[period],
-                    id=job_id,
+                    id=f"capture_period_{period}_hour_{hour:02d}",
                     max_instances=1,
                     replace_existing=True
                 )
             
             self.logger.info(f"{period}교시 캡쳐 스케줄 등록: "
-                           f"{capture_start_hour:02d}:{capture_start_minute:02d} ~ "
-                           f"{capture_end_hour:02d}:{capture_end_minute:02d}")
+                           f"{capture_start.hour:02d}:{capture_start.minute:02d} ~ "
+                           f"{capture_end.hour:02d}:{capture_end.minute:02d}")
     
     def _execute_capture(self, period: int):
         """
@@ -183,25 +188,7 @@ class ClassScheduler:
         """
         current_time = datetime.now().time()
         
-        for period, (start_time, end_time) in enumerate(self.class_schedule, 1):
-            # 캡쳐 시간 계산 (35-40분)
-            capture_start_minute = start_time.minute + 35
-            capture_end_minute = start_time.minute + 40
-            
-            capture_start_hour = start_time.hour
-            capture_end_hour = start_time.hour
-            
-            if capture_start_minute >= 60:
-                capture_start_hour += 1
-                capture_start_minute -= 60
-            
-            if capture_end_minute >= 60:
-                capture_end_hour += 1
-                capture_end_minute -= 60
-            
-            capture_start = time(capture_start_hour, capture_start_minute)
-            capture_end = time(capture_end_hour, capture_end_minute)
-            
+        for period, (capture_start, capture_end) in enumerate(self._capture_windows, 1):
             if capture_start <= current_time <= capture_end:
                 return True, period
         
@@ -5,7 +5,6 @@ mss를 사용하여 전체 화면을 캡쳐하고 시스템 시계를 포함하
 
 import mss
 import numpy as np
-from PIL import Image
 import cv2
 from datetime import datetime
 import os
@@ -55,13 +54,16 @@ class ScreenCapture:
             self.logger.debug(f"스레드 {threading.current_thread().name}에 새 mss 인스턴스 생성")
         return self._local.sct
     
-    def capture_screen(self) -> np.ndarray:
+    def capture_screen(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         전체 화면을 캡쳐하여 numpy 배열로 반환
         스레드 안전성을 위해 스레드 로컬 mss 인스턴스 사용
         
+        Args:
+            out (np.ndarray): 결과를 기록할 재사용 버퍼 (크기가 맞지 않으면 새로 할당)
+        
         Returns:
-            np.ndarray: BGR 형식의 화면 이미지
+            np.ndarray: BGR 형식의 화면 이미지 (크기가 맞으면 out 자체)
         """
         try:
             # 스레드 로컬 mss 인스턴스 가져오기
@@ -71,16 +73,19 @@ class ScreenCapture:
             monitor = sct.monitors[self.monitor_number]
             screenshot = sct.grab(monitor)
             
-            # PIL Image로 변환
-            img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+            # mss 원본 BGRA 버퍼를 복사 없이 numpy로 보기
+            bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                screenshot.height, screenshot.width, 4
+            )
             
-            # numpy 배열로 변환 (OpenCV 형식)
-            img_array = np.array(img)
-            
-            # RGB to BGR 변환 (OpenCV 표준)
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+            # BGRA to BGR 변환 (OpenCV 표준) - 가능하면 호출자 버퍼에 직접 기록
+            if out is not None and out.shape == (screenshot.height, screenshot.width, 3):
+                img_bgr = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR, dst=out)
+            else:
+                img_bgr = cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
             
-            self.logger.debug(f"화면 캡쳐 완료: {img_bgr.shape}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"화면 캡쳐 완료: {img_bgr.shape}")
             return img_bgr
             
         except Exception as e:
@@ -211,15 +216,17 @@ class ImageCandidate:
         # 선명도 계산
         sharpness = calculate_image_sharpness(image)
         
-        # 후보 추가
-        self.candidates.append((image.copy(), sharpness, timestamp))
+        # 후보가 가득 찼고 가장 흐린 후보보다도 흐리면 이미지 복사 없이 버림
+        if len(self.candidates) >= self.max_candidates and sharpness <= self.candidates[-1][1]:
+            return
         
-        # 선명도 기준으로 정렬 (높은 순)
-        self.candidates.sort(key=lambda x: x[1], reverse=True)
+        # 선명도 순서(높은 순)를 유지하도록 제자리에 삽입 - 같은 선명도면 먼저 들어온 후보가 앞
+        index = next((i for i, candidate in enumerate(self.candidates) if candidate[1] < sharpness),
+                     len(self.candidates))
+        self.candidates.insert(index, (image.copy(), sharpness, timestamp))
         
         # 최대 개수 유지
-        if len(self.candidates) > self.max_candidates:
-            self.candidates = self.candidates[:self.max_candidates]
+        del self.candidates[self.max_candidates:]
         
         self.logger.debug(f"후보 이미지 추가: 선명도={sharpness:.2f}, 총 후보수={len(self.candidates)}")
     
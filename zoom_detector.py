@@ -30,13 +30,17 @@ class ZoomParticipantDetector:
         self.max_box_area = 200000    # 최대 박스 크기
         self.aspect_ratio_min = 0.5   # 최소 가로세로 비율
         self.aspect_ratio_max = 2.0   # 최대 가로세로 비율
+        
+        # 마지막으로 로그에 남긴 (참가자 수, 얼굴 감지 수) - 값이 바뀔 때만 INFO 로그
+        self._last_logged_counts = None
     
-    def detect_participant_boxes(self, image: np.ndarray) -> List[Dict]:
+    def detect_participant_boxes(self, image: np.ndarray, gray: np.ndarray = None) -> List[Dict]:
         """
         화면에서 Zoom 참가자 박스들을 감지
         
         Args:
             image (np.ndarray): 입력 이미지 (BGR)
+            gray (np.ndarray): 미리 변환된 그레이스케일 이미지 (None이면 여기서 변환)
             
         Returns:
             List[Dict]: 감지된 박스 정보 리스트
@@ -45,8 +49,9 @@ class ZoomParticipantDetector:
         boxes = []
         
         try:
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            # 그레이스케일 변환 (호출자가 이미 변환했으면 재사용)
+            if gray is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
             
             # 가우시안 블러로 노이즈 제거
             blurred = cv2.GaussianBlur(gray, (5, 5), 0)
@@ -94,21 +99,25 @@ class ZoomParticipantDetector:
             # 면적 기준으로 정렬 (큰 것부터)
             boxes.sort(key=lambda x: x['area'], reverse=True)
             
-            self.logger.debug(f"감지된 참가자 박스 수: {len(boxes)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"감지된 참가자 박스 수: {len(boxes)}")
             
         except Exception as e:
             self.logger.error(f"참가자 박스 감지 오류: {e}")
         
         return boxes
     
-    def analyze_participant_box(self, image: np.ndarray, box: Dict, force_detection: bool = False) -> Dict:
+    def analyze_participant_box(self, image: np.ndarray, box: Dict, force_detection: bool = False,
+                                gray: np.ndarray = None, faces: List[Dict] = None) -> Dict:
         """
         개별 참가자 박스 분석 (얼굴 감지 포함)
         
         Args:
-            image (np.ndarray): 전체 이미지
+            image (np.ndarray): 전체 이미지 (BGR, 얼굴 감지용)
             box (Dict): 박스 정보
             force_detection (bool): 강제 탐지 모드
+            gray (np.ndarray): 전체 이미지의 그레이스케일 (밝기 분석용, None이면 박스 영역만 변환)
+            faces (List[Dict]): 이미 탐지된 박스 영역의 얼굴 (None이면 여기서 탐지)
             
         Returns:
             Dict: 분석 결과
@@ -129,8 +138,9 @@ class ZoomParticipantDetector:
         
         try:
             if roi.size > 0:
-                # 얼굴 감지
-                faces = self.face_detector.detect_faces(roi, force_detection=force_detection)
+                # 얼굴 감지 (일괄 탐지 결과가 없으면 직접 탐지)
+                if faces is None:
+                    faces = self.face_detector.detect_faces(roi, force_detection=force_detection)
                 
                 if faces:
                     analysis['has_face'] = True
@@ -138,7 +148,10 @@ class ZoomParticipantDetector:
                     analysis['face_confidence'] = max([face['confidence'] for face in faces])
                 
                 # 밝기 분석 (활성 상태 판단)
-                gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+                if gray is not None:
+                    gray_roi = gray[y:y+h, x:x+w]
+                else:
+                    gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
                 analysis['brightness'] = np.mean(gray_roi)
                 
                 # 밝기가 일정 수준 이상이면 활성 상태로 간주
@@ -149,26 +162,40 @@ class ZoomParticipantDetector:
         
         return analysis
     
-    def detect_and_analyze_all(self, image: np.ndarray, force_detection: bool = False) -> Tuple[List[Dict], int, int]:
+    def detect_and_analyze_all(self, image: np.ndarray, force_detection: bool = False,
+                               gray: np.ndarray = None) -> Tuple[List[Dict], int, int]:
         """
         모든 참가자 박스를 감지하고 분석
         
+        박스 감지와 밝기 분석은 그레이스케일 한 장을 공유하고,
+        얼굴 감지(YuNet은 3채널 입력 필요)만 컬러 이미지를 사용
+        
         Args:
-            image (np.ndarray): 입력 이미지
+            image (np.ndarray): 입력 이미지 (BGR)
             force_detection (bool): 강제 탐지 모드
+            gray (np.ndarray): 미리 변환된 그레이스케일 이미지 (None이면 여기서 한 번 변환)
             
         Returns:
             Tuple[List[Dict], int, int]: (분석 결과 리스트, 총 참가자 수, 얼굴 감지된 수)
         """
+        # 그레이스케일 변환은 프레임당 한 번만
+        if gray is None:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        
         # 참가자 박스 감지
-        boxes = self.detect_participant_boxes(image)
+        boxes = self.detect_participant_boxes(image, gray=gray)
+        
+        # 모든 박스 영역의 얼굴을 한 번에 탐지 (탐지기 준비/잠금은 프레임당 한 번)
+        rois = [image[y:y+h, x:x+w] for x, y, w, h in (box['bbox'] for box in boxes)]
+        faces_per_box = self.face_detector.detect_faces_batch(rois, force_detection=force_detection)
         
         # 각 박스 분석
         analysis_results = []
         face_detected_count = 0
         
-        for box in boxes:
-            analysis = self.analyze_participant_box(image, box, force_detection=force_detection)
+        for box, faces in zip(boxes, faces_per_box):
+            analysis = self.analyze_participant_box(image, box, force_detection=force_detection,
+                                                    gray=gray, faces=faces)
             analysis_results.append(analysis)
             
             if analysis['has_face']:
@@ -176,7 +203,11 @@ class ZoomParticipantDetector:
         
         total_participants = len(boxes)
         
-        self.logger.info(f"총 참가자: {total_participants}, 얼굴 감지: {face_detected_count}")
+        # 매 프레임 같은 내용을 남기지 않도록 결과가 바뀔 때만 기록
+        counts = (total_participants, face_detected_count)
+        if counts != self._last_logged_counts:
+            self._last_logged_counts = counts
+            self.logger.info(f"총 참가자: {total_participants}, 얼굴 감지: {face_detected_count}")
         
         return analysis_results, total_participants, face_detected_count
 